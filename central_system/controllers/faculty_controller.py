@@ -2,6 +2,7 @@ import logging
 import json
 import time
 from datetime import datetime
+from sqlalchemy import or_, select
 from sqlalchemy.exc import SQLAlchemyError
 
 from central_system.models.base import session_scope, db_operation_with_retry
@@ -35,6 +36,7 @@ class FacultyController:
         """Initialize the faculty controller."""
         self.mqtt_service = get_mqtt_service()
         self.config = get_config()
+        self.callbacks = []
 
         # Subscribe to faculty status updates
         self.mqtt_service.subscribe(
@@ -51,6 +53,40 @@ class FacultyController:
 
         logger.info("FacultyController initialized")
 
+    def register_callback(self, callback):
+        """
+        Register a callback to be called when a faculty member's status changes.
+
+        Args:
+            callback (callable): Function that takes a faculty ID and the new
+                availability (bool) as arguments. Called from the MQTT thread.
+        """
+        self.callbacks.append(callback)
+        logger.info(
+            f"Registered Faculty controller callback: {getattr(callback, '__name__', 'unnamed_callback')}")
+
+    def unregister_callback(self, callback):
+        """
+        Unregister a previously registered callback.
+
+        Args:
+            callback (callable): Function to unregister
+        """
+        if callback in self.callbacks:
+            self.callbacks.remove(callback)
+            logger.info(
+                f"Unregistered Faculty controller callback: {getattr(callback, '__name__', 'unknown')}")
+
+    def _notify_callbacks(self, faculty_id, available):
+        """
+        Notify all registered callbacks.
+        """
+        for callback in self.callbacks:
+            try:
+                callback(faculty_id, available)
+            except Exception as e:
+                logger.error(f"Error in Faculty controller callback: {str(e)}")
+
     def handle_faculty_status_update(self, topic, payload):
         """Handle faculty status updates from MQTT."""
         try:
@@ -179,6 +215,9 @@ class FacultyController:
                     f"Updated faculty {faculty_id} status: available={available}, ble_presence={ble_presence}")
             else:
                 logger.warning(f"Faculty with ID {faculty_id} not found in database")
+                return
+
+        self._notify_callbacks(faculty_id, bool(available))
 
     @db_operation_with_retry
     def update_faculty_availability(self, faculty_id, available):
@@ -197,31 +236,84 @@ class FacultyController:
                 logger.info(f"Updated faculty {faculty_id} availability: {available}")
             else:
                 logger.warning(f"Faculty with ID {faculty_id} not found in database")
+                return
 
-    def get_all_faculty(self):
-        """Get all faculty from the database."""
-        try:
-            with session_scope() as session:
-                faculty_list = session.query(Faculty).all()
+        self._notify_callbacks(faculty_id, bool(available))
 
-                # Convert to list of dictionaries
-                result = []
-                for faculty in faculty_list:
-                    result.append({
-                        'id': faculty.id,
-                        'name': faculty.name,
-                        'department': faculty.department,
-                        'is_available': faculty.is_available,
-                        'ble_presence_detected': faculty.ble_presence_detected,
-                        'last_status_update': faculty.last_status_update.isoformat() if faculty.last_status_update else None
-                    })
+    def get_all_faculty(self, filter_available=None, search_term=None, raise_errors=False):
+        """
+        Get faculty from the database, optionally filtered in the query itself.
 
-                return result
+        Args:
+            filter_available (bool): Only return faculty with this availability; None for all
+            search_term (str): Only return faculty whose name or department contains
+                this text, ignoring case; None or empty for all
+            raise_errors (bool): Re-raise database errors instead of returning an empty
+                list, so callers can tell a failed query from an empty table
+
+        Returns:
+            list: Faculty objects, detached from the session with their columns loaded
+        """
+        try:
+            with session_scope() as session:
+                query = session.query(Faculty)
+                if filter_available is not None:
+                    query = query.filter(Faculty.is_available == filter_available)
+                if search_term:
+                    pattern = f"%{search_term}%"
+                    query = query.filter(or_(Faculty.name.ilike(pattern),
+                                             Faculty.department.ilike(pattern)))
+                faculty_list = query.all()
+
+                # Detach before the scope commits so the loaded columns are not
+                # expired and stay readable from the UI thread
+                session.expunge_all()
+                return faculty_list
         except SQLAlchemyError as e:
             logger.error(f"Database error getting all faculty: {e}")
+            if raise_errors:
+                raise
             return []
         except Exception as e:
             logger.error(f"Error getting all faculty: {e}")
+            if raise_errors:
+                raise
+            return []
+
+    def get_all_faculty_lite(self, filter_available=None, search_term=None, raise_errors=False):
+        """
+        Get the ID, name and availability of faculty, without loading full rows.
+        Cheap enough to poll for change detection; filters match get_all_faculty().
+
+        Args:
+            filter_available (bool): Only return faculty with this availability; None for all
+            search_term (str): Only return faculty whose name or department contains
+                this text, ignoring case; None or empty for all
+            raise_errors (bool): Re-raise database errors instead of returning an empty
+                list, so a failed check is never mistaken for an empty fingerprint
+
+        Returns:
+            list: (id, name, is_available) tuples ordered by ID
+        """
+        try:
+            with session_scope() as session:
+                query = select(Faculty.id, Faculty.name, Faculty.is_available).order_by(Faculty.id)
+                if filter_available is not None:
+                    query = query.where(Faculty.is_available == filter_available)
+                if search_term:
+                    pattern = f"%{search_term}%"
+                    query = query.where(or_(Faculty.name.ilike(pattern),
+                                            Faculty.department.ilike(pattern)))
+                return [tuple(row) for row in session.execute(query).all()]
+        except SQLAlchemyError as e:
+            logger.error(f"Database error getting faculty status: {e}")
+            if raise_errors:
+                raise
+            return []
+        except Exception as e:
+            logger.error(f"Error getting faculty status: {e}")
+            if raise_errors:
+                raise
             return []
 
     def get_faculty_by_id(self, faculty_id):
@@ -652,8 +652,10 @@ class ConsultEaseApp:
         Handle faculty data updated event.
         """
         logger.info("Faculty data updated, refreshing dashboard if visible.")
-        if self.dashboard_window and self.dashboard_window.isVisible():
-            self.dashboard_window.refresh_faculty_status()
+        if self.dashboard_window:
+            self.dashboard_window.invalidate_faculty_cache()
+            if self.dashboard_window.isVisible():
+                self.dashboard_window.refresh_faculty_status()
 
     def handle_student_updated(self):
         """
@@ -1,6 +1,6 @@
 from sqlalchemy import Column, Integer, String, Boolean, DateTime
 from sqlalchemy.sql import func
-from sqlalchemy.orm import validates
+from sqlalchemy.orm import synonym, validates
 from .base import Base
 import os
 import re
@@ -23,6 +23,8 @@ class Faculty(Base):
     ble_id = Column(String, unique=True, index=True)
     image_path = Column(String, nullable=True)  # Path to faculty image
     is_available = Column(Boolean, default=False, index=True)  # False = Unavailable, True = Available
+    # Alias used by the views, which read and set faculty.status
+    status = synonym('is_available')
     # If True, faculty is always shown as available
     always_available = Column(Boolean, default=False)
     # New field to track grace period status
@@ -0,0 +1,86 @@
+"""
+Case-insensitive substring search over a fixed list of strings.
+Large lists are searched by a Numba kernel over a packed byte buffer when
+numba is installed; otherwise plain Python string matching is used.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+# numba is optional; without it every search uses the pure-Python path
+try:
+    import numpy as np
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    np = None
+    njit = None
+    _HAS_NUMBA = False
+
+# Below this many strings the interpreter is faster than calling the kernel
+NUMBA_MIN_RECORDS = 500
+
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _find_matches(buf, offsets, lengths, needle):
+        """
+        Return a bool array marking the records of buf that contain needle.
+        """
+        count = offsets.shape[0]
+        needle_len = needle.shape[0]
+        first = needle[0]
+        result = np.zeros(count, dtype=np.bool_)
+        for i in range(count):
+            start = offsets[i]
+            for j in range(start, start + lengths[i] - needle_len + 1):
+                # Cheap first-byte check before comparing the rest
+                if buf[j] != first:
+                    continue
+                k = 1
+                while k < needle_len and buf[j + k] == needle[k]:
+                    k += 1
+                if k == needle_len:
+                    result[i] = True
+                    break
+        return result
+
+
+class SubstringIndex:
+    """
+    Case-insensitive substring index over a list of strings.
+    Build it once per data refresh and call match() for each search.
+    """
+
+    def __init__(self, texts):
+        """
+        Args:
+            texts (list): Strings to search, in result order
+        """
+        self._texts = [text.lower() for text in texts]
+        self._packed = None
+        if _HAS_NUMBA and len(self._texts) >= NUMBA_MIN_RECORDS:
+            # UTF-8 is self-synchronizing, so a byte match is a character match
+            encoded = [text.encode('utf-8') for text in self._texts]
+            lengths = np.array([len(e) for e in encoded], dtype=np.int64)
+            offsets = np.zeros(len(encoded), dtype=np.int64)
+            np.cumsum(lengths[:-1], out=offsets[1:])
+            buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+            self._packed = (buf, offsets, lengths)
+
+    def match(self, needle):
+        """
+        Find which strings contain the needle, ignoring case.
+
+        Args:
+            needle (str): Text to search for
+
+        Returns:
+            list: One bool per indexed string
+        """
+        needle = needle.lower()
+        if not needle:
+            return [True] * len(self._texts)
+        if self._packed is not None:
+            needle_buf = np.frombuffer(needle.encode('utf-8'), dtype=np.uint8)
+            return _find_matches(*self._packed, needle_buf).tolist()
+        return [needle in text for text in self._texts]
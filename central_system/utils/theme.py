@@ -412,3 +412,8 @@ class ConsultEaseTheme:
                 font-weight: bold;
             }}
         """
+
+
+# Shared theme instance. ConsultEaseTheme holds only class-level tokens, so widgets
+# use this one instance instead of constructing their own.
+THEME = ConsultEaseTheme()
@@ -8,7 +8,8 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QComboBox, QMessageBox, QTabWidget, QTableWidget,
                              QTableWidgetItem, QHeaderView, QDialog, QFormLayout,
                              QSizePolicy, QProgressBar, QApplication)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QPoint, QSize
+from PyQt5.QtCore import (Qt, pyqtSignal, QTimer, QPoint, QSize,
+                          QAbstractListModel, QModelIndex)
 from PyQt5.QtGui import QColor, QIcon
 
 import logging
@@ -23,6 +24,50 @@ from ..utils.icons import IconProvider, Icons
 logger = logging.getLogger(__name__)
 
 
+class FacultyListModel(QAbstractListModel):
+    """
+    List model exposing faculty members to a QComboBox.
+    Rows are served straight from the Python list, so no per-row items are built.
+    """
+
+    def __init__(self, faculty_list=None, parent=None):
+        super().__init__(parent)
+        self._faculty_list = list(faculty_list or [])
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._faculty_list)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._faculty_list):
+            return None
+
+        faculty = self._faculty_list[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{faculty.name} ({faculty.department})"
+        if role == Qt.UserRole:
+            return faculty.id
+        return None
+
+    def set_faculty_list(self, faculty_list):
+        """
+        Replace the faculty list backing the model.
+        """
+        self.beginResetModel()
+        self._faculty_list = list(faculty_list or [])
+        self.endResetModel()
+
+    def row_for_faculty_id(self, faculty_id):
+        """
+        Get the row of the faculty with the given ID, or -1 if not present.
+        """
+        for row, faculty in enumerate(self._faculty_list):
+            if faculty.id == faculty_id:
+                return row
+        return -1
+
+
 class ConsultationRequestForm(QFrame):
     """
     Form to request a consultation with a faculty member.
@@ -134,6 +179,8 @@ class ConsultationRequestForm(QFrame):
         # faculty_label.setFixedWidth(120) # Remove fixed width for better flow
         self.faculty_combo = QComboBox()
         self.faculty_combo.setMinimumWidth(250)  # Ensure enough width
+        self.faculty_model = FacultyListModel(parent=self.faculty_combo)
+        self.faculty_combo.setModel(self.faculty_model)
         # self.faculty_combo.setToolTip("Select the faculty member for consultation.") # Add tooltip
         main_layout.addWidget(faculty_label)
         main_layout.addWidget(self.faculty_combo)
@@ -248,29 +295,27 @@ class ConsultationRequestForm(QFrame):
 
         # Update the combo box
         if self.faculty and self.faculty_combo.count() > 0:
-            for i in range(self.faculty_combo.count()):
-                faculty_id = self.faculty_combo.itemData(i)
-                if faculty_id == self.faculty.id:
-                    self.faculty_combo.setCurrentIndex(i)
-                    break
+            self._select_faculty_row(self.faculty.id)
 
     def set_faculty_options(self, faculty_list):
         """
         Set the available faculty options in the dropdown.
         """
         self.faculty_options = faculty_list
-        self.faculty_combo.clear()
-
-        for faculty in faculty_list:
-            self.faculty_combo.addItem(f"{faculty.name} ({faculty.department})", faculty.id)
+        # Rows are served by the model; no per-item widget work on the UI thread
+        self.faculty_model.set_faculty_list(faculty_list)
 
         # If we have a selected faculty, select it in the dropdown
         if self.faculty:
-            for i in range(self.faculty_combo.count()):
-                faculty_id = self.faculty_combo.itemData(i)
-                if faculty_id == self.faculty.id:
-                    self.faculty_combo.setCurrentIndex(i)
-                    break
+            self._select_faculty_row(self.faculty.id)
+
+    def _select_faculty_row(self, faculty_id):
+        """
+        Select the dropdown row for the given faculty ID, if present.
+        """
+        row = self.faculty_model.row_for_faculty_id(faculty_id)
+        if row >= 0:
+            self.faculty_combo.setCurrentIndex(row)
 
     def get_selected_faculty(self):
         """
@@ -1012,14 +1057,21 @@ class ConsultationPanel(QTabWidget):
         if student and hasattr(self.parent(), 'setWindowTitle'):
             self.parent().setWindowTitle(f"ConsultEase - {student.name}")
 
-    def set_faculty(self, faculty):
+    def set_faculty(self, faculty, animate=True):
         """
         Set the faculty for the consultation request.
+
+        Args:
+            faculty (object): Faculty object to request consultation with
+            animate (bool): Whether to animate the switch to the request form tab
         """
         self.request_form.set_faculty(faculty)
 
-        # Animate transition to request form tab
-        self.animate_tab_change(0)
+        # Transition to request form tab
+        if animate:
+            self.animate_tab_change(0)
+        else:
+            self.setCurrentIndex(0)
 
     def set_faculty_options(self, faculty_list):
         """
@@ -2,12 +2,17 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QGridLayout, QScrollArea, QFrame,
                              QLineEdit, QTextEdit, QComboBox, QMessageBox,
                              QSplitter, QApplication, QSizePolicy, QGraphicsDropShadowEffect)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QSize, QSettings
-from PyQt5.QtGui import QIcon, QColor, QPixmap
+from PyQt5.QtCore import (Qt, pyqtSignal, QTimer, QSize, QSettings, QObject,
+                          QRunnable, QThreadPool, QSignalBlocker, QRectF)
+from PyQt5.QtGui import (QIcon, QColor, QPixmap, QImage, QPixmapCache, QPainter,
+                         QPainterPath, QPen)
+from PyQt5 import sip
 
 import os
 import logging
+import math
 import time  # Moved import time here
+from collections import deque
 from .base_window import BaseWindow
 from .consultation_panel import ConsultationPanel
 from ..controllers import FacultyController, ConsultationController
@@ -16,12 +21,176 @@ from ..models.student import Student
 from ..models.consultation import Consultation
 from ..config import get_config
 from ..services import get_rfid_service, get_mqtt_service
-from ..utils.notification_manager import NotificationManager
-from ..utils.theme import ConsultEaseTheme  # Added Theme import
+from ..utils.theme import THEME  # Added Theme import
+from ..utils.ui_components import NotificationBanner
+from ..utils.text_search import SubstringIndex
+
+# Resolve the notification manager once instead of on every notification
+try:
+    from ..utils.notification_manager import NotificationManager
+    _HAS_NM = True
+except ImportError:
+    NotificationManager = None
+    _HAS_NM = False
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Standardized notification types for the message types the dashboard uses
+_STD_TYPE = ({k: NotificationManager.get_standardized_type(k)
+              for k in ("info", "success", "warning", "error")} if _HAS_NM else {})
+
+# Notification titles by message type
+_TITLE_MAP = {
+    "error": "Error",
+    "success": "Success",
+    "warning": "Warning",
+    "info": "Information",
+}
+
+# Refreshes within this many ms of the last faculty load reuse the cached list.
+# Status changes invalidate the cache, so this only bounds staleness of other edits.
+_FACULTY_CACHE_TTL_MS = 30000
+
+# Thread pool for decoding faculty images off the UI thread (created on first use)
+_image_loader_pool = None
+
+# Image paths being decoded by a warm-start batch; cards showing them wait for the batch
+_warming_image_paths = set()
+
+
+def _get_image_loader_pool():
+    """
+    Get the thread pool used for faculty image decoding.
+    """
+    global _image_loader_pool
+    if _image_loader_pool is None:
+        _image_loader_pool = QThreadPool()
+    return _image_loader_pool
+
+
+def _make_circular_image(image, size, border_color, background_color):
+    """
+    Draw an image centered in a circle with a border, as shown on faculty cards.
+    Uses only QImage and QPainter, so it is safe to call on a worker thread.
+
+    Args:
+        image (QImage): Image to draw; parts outside the circle are clipped
+        size (QSize): Size of the resulting image
+        border_color (str): Color of the circle outline
+        background_color (str): Color behind transparent parts of the image
+
+    Returns:
+        QImage: Image with a transparent background outside the circle
+    """
+    result = QImage(size, QImage.Format_ARGB32_Premultiplied)
+    result.fill(Qt.transparent)
+
+    circle = QPainterPath()
+    circle.addEllipse(QRectF(1, 1, size.width() - 2, size.height() - 2))
+
+    painter = QPainter(result)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.fillPath(circle, QColor(background_color))
+    painter.setClipPath(circle)
+    painter.drawImage((size.width() - image.width()) // 2,
+                      (size.height() - image.height()) // 2, image)
+    painter.setClipping(False)
+    painter.setPen(QPen(QColor(border_color), 2))
+    painter.drawPath(circle)
+    painter.end()
+    return result
+
+
+def _faculty_image_cache_key(image_path):
+    """
+    Get the QPixmapCache key for a faculty image.
+    Keyed by modification time so a replaced file is decoded again.
+
+    Returns:
+        str: Cache key, or None if the file cannot be accessed
+    """
+    try:
+        mtime = os.path.getmtime(image_path)
+    except OSError:
+        return None
+    return f"{image_path}:{mtime}:60"
+
+
+class FacultyImageSignals(QObject):
+    """
+    Signals emitted by FacultyImageLoader.
+    """
+    loaded = pyqtSignal(str, QImage)
+
+
+class FacultyImageLoader(QRunnable):
+    """
+    Decode and scale faculty images on a worker thread, emitting each as it is done.
+    Each image is scaled to fill, cropped to exactly the target size and clipped
+    to a circle, so the label paints it as-is. Only QImage is used here;
+    conversion to QPixmap happens on the UI thread.
+    """
+
+    def __init__(self, image_paths, size, border_color, background_color):
+        super().__init__()
+        self.image_paths = image_paths
+        self.size = size
+        self.border_color = border_color
+        self.background_color = background_color
+        self.signals = FacultyImageSignals()
+
+    def run(self):
+        for image_path in self.image_paths:
+            image = QImage()
+            if image.load(image_path):
+                image = image.scaled(self.size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+                if image.size() != self.size:
+                    # Crop the overflow evenly from both sides
+                    image = image.copy((image.width() - self.size.width()) // 2,
+                                       (image.height() - self.size.height()) // 2,
+                                       self.size.width(), self.size.height())
+                image = _make_circular_image(image, self.size, self.border_color, self.background_color)
+            self.signals.loaded.emit(image_path, image)
+
+
+class FacultyListSignals(QObject):
+    """
+    Signals emitted by FacultyListLoader.
+    """
+    loaded = pyqtSignal(int, object, object)  # query id, faculty list, status fingerprint
+    unchanged = pyqtSignal(int)  # query id; the cached list is still current
+    failed = pyqtSignal(int, str)  # query id, error message
+
+
+class FacultyListLoader(QRunnable):
+    """
+    Query the faculty list on a worker thread so a slow database round-trip
+    does not block the UI. The cheap (id, name, availability) query runs first;
+    the full list is only loaded when that differs from the previous load.
+    Results are tagged with the query id so the dashboard can drop completions
+    that a newer query superseded.
+    """
+
+    def __init__(self, query_id, faculty_controller, last_fingerprint=None):
+        super().__init__()
+        self.query_id = query_id
+        self.faculty_controller = faculty_controller
+        self.last_fingerprint = last_fingerprint
+        self.signals = FacultyListSignals()
+
+    def run(self):
+        try:
+            fingerprint = hash(tuple(self.faculty_controller.get_all_faculty_lite(raise_errors=True)))
+            if self.last_fingerprint is not None and fingerprint == self.last_fingerprint:
+                self.signals.unchanged.emit(self.query_id)
+                return
+            faculties = self.faculty_controller.get_all_faculty(raise_errors=True)
+        except Exception as e:
+            self.signals.failed.emit(self.query_id, str(e))
+            return
+        self.signals.loaded.emit(self.query_id, faculties, fingerprint)
+
 
 class FacultyCard(QFrame):
     """
@@ -29,15 +198,28 @@ class FacultyCard(QFrame):
     """
     consultation_requested = pyqtSignal(object)
 
+    # Default avatar shared by all cards without an image
+    _default_pixmap = None
+    # Whether the process-wide QPixmapCache limit has been configured
+    _pixmap_cache_configured = False
+    # Stylesheets shared by all cards, built once by _build_stylesheets
+    _stylesheets_built = False
+
     def __init__(self, faculty, parent=None):
         super().__init__(parent)
         self.faculty = faculty
-        self.theme = ConsultEaseTheme()  # Store theme instance
-        self.init_ui()
-
-    def init_ui(self):
+        self.theme = THEME  # Shared theme instance
+        self._last_status = None  # Status the current styles were applied for
+        self._last_seen = None  # Displayed fields, set once the card is hydrated
+        self._hydrated = False
+        if not FacultyCard._stylesheets_built:
+            FacultyCard._build_stylesheets(self.theme)
+        self.init_frame()
+
+    def init_frame(self):
         """
-        Initialize the faculty card UI.
+        Set up the lightweight placeholder frame with the card's final dimensions.
+        The card contents are built later by hydrate().
         """
         self.setFrameShape(QFrame.StyledPanel)
         self.setObjectName("facultyCard")  # For specific card styling
@@ -47,6 +229,108 @@ class FacultyCard(QFrame):
         self.setMinimumHeight(180)  # Adjusted height
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
 
+    def is_hydrated(self):
+        """
+        Check whether the card contents have been built.
+        """
+        return self._hydrated
+
+    def hydrate(self):
+        """
+        Build the card contents (image, labels, styles) if not done yet.
+        Called by the dashboard when the card scrolls into view.
+        """
+        if self._hydrated:
+            return
+        self._hydrated = True
+        self._last_seen = self._faculty_fingerprint(self.faculty)
+        self.init_ui()
+
+    @classmethod
+    def _build_stylesheets(cls, theme):
+        """
+        Build the card stylesheets once so cards only pass pre-built strings to Qt.
+
+        Args:
+            theme (ConsultEaseTheme): Theme providing colors and sizes
+        """
+        # Status colors are selected by the dynamic "status" property, so a status
+        # change only re-polishes the affected widgets instead of parsing new CSS
+        cls._CARD_CSS = f"""
+            QFrame#facultyCard {{
+                border: 1px solid {theme.BORDER_COLOR};
+                border-radius: {theme.BORDER_RADIUS_LARGE}px;
+                /* margin is handled by grid layout spacing */
+            }}
+            QFrame#facultyCard[status="available"] {{
+                background-color: {theme.BG_PRIMARY}; /* White background for available */
+                border-color: {theme.SUCCESS_COLOR};
+            }}
+            QFrame#facultyCard[status="unavailable"] {{
+                background-color: #fff0f0; /* Very light red for unavailable, distinct but not harsh */
+                border-color: {theme.ERROR_COLOR};
+            }}
+            QLabel#statusIcon {{
+                font-size: 18pt;
+                border: none;
+            }}
+            QLabel#statusText {{
+                font-size: {theme.FONT_SIZE_NORMAL}pt;
+                font-weight: bold;
+                border: none;
+            }}
+            QLabel#statusIcon[status="available"], QLabel#statusText[status="available"] {{
+                color: {theme.SUCCESS_COLOR};
+            }}
+            QLabel#statusIcon[status="unavailable"], QLabel#statusText[status="unavailable"] {{
+                color: {theme.ERROR_COLOR};
+            }}
+        """
+
+        # The avatar pixmaps are already circular with their own border
+        cls._IMAGE_CSS = "QLabel { border: none; background: transparent; }"
+        cls._NAME_CSS = f"""
+            QLabel {{
+                font-size: {theme.FONT_SIZE_LARGE}pt;
+                font-weight: bold;
+                color: {theme.TEXT_PRIMARY};
+            }}
+        """
+        cls._DEPT_CSS = f"""
+            QLabel {{
+                font-size: {theme.FONT_SIZE_NORMAL}pt;
+                color: {theme.TEXT_SECONDARY};
+            }}
+        """
+        cls._SEPARATOR_CSS = f"background-color: {theme.BORDER_COLOR_LIGHT};"
+        cls._BUTTON_CSS = f"""
+            QPushButton#requestButton {{
+                font-size: {theme.FONT_SIZE_NORMAL}pt;
+                padding: 10px;
+                border-radius: {theme.BORDER_RADIUS_NORMAL}px;
+                background-color: {theme.PRIMARY_COLOR};
+                color: {theme.TEXT_LIGHT};
+                font-weight: bold;
+            }}
+            QPushButton#requestButton:hover {{
+                background-color: {theme.PRIMARY_COLOR_HOVER};
+            }}
+            QPushButton#requestButton:disabled {{
+                background-color: {theme.TEXT_SECONDARY};
+                color: {theme.BG_PRIMARY_MUTED};
+            }}
+        """
+        cls._stylesheets_built = True
+
+    def init_ui(self):
+        """
+        Initialize the faculty card UI.
+        Runs once per card, from hydrate(), so the button is connected exactly once;
+        later data changes go through update_faculty().
+        """
+        assert self.layout() is None, "FacultyCard.init_ui() must only run once"
+        self.setStyleSheet(FacultyCard._CARD_CSS)
+
         # Main layout for the card
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(15, 15, 15, 15)
@@ -58,15 +342,9 @@ class FacultyCard(QFrame):
 
         self.image_label = QLabel()
         self.image_label.setFixedSize(60, 60)
-        self.image_label.setScaledContents(True)
-        self.image_label.setStyleSheet(f"""
-            QLabel {{
-                border: 2px solid {self.theme.BORDER_COLOR};
-                border-radius: 30px; /* Circular image */
-                background-color: {self.theme.BG_PRIMARY};
-                padding: 2px;
-            }}
-        """)
+        # Images are pre-scaled to 60x60 by the loader, so no per-paint scaling is needed
+        self.image_label.setAlignment(Qt.AlignCenter)
+        self.image_label.setStyleSheet(FacultyCard._IMAGE_CSS)
         self._load_faculty_image()
         top_layout.addWidget(self.image_label)
 
@@ -74,23 +352,12 @@ class FacultyCard(QFrame):
         name_dept_layout.setSpacing(3)
         self.name_label = QLabel(self.faculty.name)
         self.name_label.setWordWrap(True)
-        self.name_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: {self.theme.FONT_SIZE_LARGE}pt;
-                font-weight: bold;
-                color: {self.theme.TEXT_PRIMARY};
-            }}
-        """)
+        self.name_label.setStyleSheet(FacultyCard._NAME_CSS)
         name_dept_layout.addWidget(self.name_label)
 
         self.dept_label = QLabel(self.faculty.department)
         self.dept_label.setWordWrap(True)
-        self.dept_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: {self.theme.FONT_SIZE_NORMAL}pt;
-                color: {self.theme.TEXT_SECONDARY};
-            }}
-        """)
+        self.dept_label.setStyleSheet(FacultyCard._DEPT_CSS)
         name_dept_layout.addWidget(self.dept_label)
         top_layout.addLayout(name_dept_layout)
         top_layout.addStretch()
@@ -101,14 +368,16 @@ class FacultyCard(QFrame):
         separator.setFrameShape(QFrame.HLine)
         separator.setFrameShadow(QFrame.Sunken)
         separator.setFixedHeight(1)
-        separator.setStyleSheet(f"background-color: {self.theme.BORDER_COLOR_LIGHT};")
+        separator.setStyleSheet(FacultyCard._SEPARATOR_CSS)
         main_layout.addWidget(separator)
 
         # Middle part: Status
         status_layout = QHBoxLayout()
         status_layout.setSpacing(6)
         self.status_icon_label = QLabel("●")  # Unicode circle
+        self.status_icon_label.setObjectName("statusIcon")
         self.status_text_label = QLabel()
+        self.status_text_label.setObjectName("statusText")
         status_layout.addWidget(self.status_icon_label)
         status_layout.addWidget(self.status_text_label)
         status_layout.addStretch()
@@ -124,116 +393,185 @@ class FacultyCard(QFrame):
                 Icons.CALENDAR_ADD if hasattr(
                     Icons, 'CALENDAR_ADD') else Icons.ADD, QSize(
                     18, 18)))
-        self.request_button.setStyleSheet(f"""
-            QPushButton#requestButton {{
-                font-size: {self.theme.FONT_SIZE_NORMAL}pt;
-                padding: 10px;
-                border-radius: {self.theme.BORDER_RADIUS_NORMAL}px;
-                background-color: {self.theme.PRIMARY_COLOR};
-                color: {self.theme.TEXT_LIGHT};
-                font-weight: bold;
-            }}
-            QPushButton#requestButton:hover {{
-                background-color: {self.theme.PRIMARY_COLOR_HOVER};
-            }}
-            QPushButton#requestButton:disabled {{
-                background-color: {self.theme.TEXT_SECONDARY};
-                color: {self.theme.BG_PRIMARY_MUTED};
-            }}
-        """)
+        self.request_button.setStyleSheet(FacultyCard._BUTTON_CSS)
         self.request_button.clicked.connect(self.request_consultation)
         main_layout.addWidget(self.request_button)
 
         self.update_style_and_status()  # Initial style and status update
 
-        # Add shadow effect
+        # No permanent shadow effect: it is blurred in software on every paint of every
+        # card. Only the hovered card gets one (see enterEvent/leaveEvent).
+
+    def enterEvent(self, event):
+        """
+        Add a shadow effect while the card is hovered.
+        """
         shadow = QGraphicsDropShadowEffect(self)
         shadow.setBlurRadius(15)
         shadow.setColor(QColor(0, 0, 0, 60))
         shadow.setOffset(0, 3)
         self.setGraphicsEffect(shadow)
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        """
+        Remove the hover shadow effect.
+        """
+        self.setGraphicsEffect(None)
+        super().leaveEvent(event)
 
     def update_style_and_status(self):
         """
         Updates card style based on faculty status and text labels.
         """
-        if self.faculty.status:
-            border_color = self.theme.SUCCESS_COLOR
-            status_text = "Available"
-            status_icon_color = self.theme.SUCCESS_COLOR
-            self.request_button.setEnabled(True)
-            card_bg = self.theme.BG_PRIMARY  # White background for available
-        else:
-            border_color = self.theme.ERROR_COLOR
-            status_text = "Unavailable"
-            status_icon_color = self.theme.ERROR_COLOR
-            self.request_button.setEnabled(False)
-            card_bg = "#fff0f0"  # Very light red for unavailable, distinct but not harsh
-
-        self.setStyleSheet(f"""
-            QFrame#facultyCard {{
-                background-color: {card_bg};
-                border: 1px solid {border_color};
-                border-radius: {self.theme.BORDER_RADIUS_LARGE}px;
-                /* margin is handled by grid layout spacing */
-            }}
-            /* Other specific styles for elements inside this card if needed */
-        """)
-
-        self.status_icon_label.setStyleSheet(
-            f"font-size: 18pt; color: {status_icon_color}; border: none;")
-        self.status_text_label.setText(status_text)
-        self.status_text_label.setStyleSheet(
-            f"font-size: {self.theme.FONT_SIZE_NORMAL}pt; color: {status_icon_color}; font-weight: bold; border: none;")
+        status = bool(self.faculty.status)
+        if status == self._last_status:
+            return  # Styles already match this status
+        self._last_status = status
+
+        self.request_button.setEnabled(status)
+        self.status_text_label.setText("Available" if status else "Unavailable")
+        status_value = "available" if status else "unavailable"
+        for widget in (self, self.status_icon_label, self.status_text_label):
+            widget.setProperty("status", status_value)
+            # Dynamic property changes only take effect after a re-polish
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+
+    @classmethod
+    def ensure_pixmap_cache_limit(cls):
+        """
+        Size the process-wide QPixmapCache for faculty thumbnails, once.
+        """
+        if not cls._pixmap_cache_configured:
+            QPixmapCache.setCacheLimit(20 * 1024)  # In KB
+            cls._pixmap_cache_configured = True
 
     def _load_faculty_image(self):
-        pixmap_loaded = False
+        FacultyCard.ensure_pixmap_cache_limit()
+
         # Assume self.faculty.get_image_path() returns an absolute, verified path or None
         image_path = self.faculty.get_image_path() if hasattr(self.faculty, 'get_image_path') else None
+        self._image_path = image_path
+        self._image_cache_key = None
 
         if image_path:  # If model provides a valid path
-            try:
-                pixmap = QPixmap(image_path)
-                if not pixmap.isNull():
-                    self.image_label.setPixmap(pixmap)
-                    pixmap_loaded = True
-                else:
-                    logger.warning(
-                        f"Could not load image for faculty {self.faculty.name} from provided path: {image_path} (pixmap isNull)")
-            except Exception as e:
-                logger.error(
-                    f"Error loading faculty image for {self.faculty.name} from {image_path}: {str(e)}")
-
-        if not pixmap_loaded:
-            # Fallback to default icon
-            try:
-                # Assuming IconProvider.get_icon returns a QIcon object
-                default_qicon = IconProvider.get_icon(Icons.USER)
-                if default_qicon and not default_qicon.isNull():
-                    self.image_label.setPixmap(default_qicon.pixmap(
-                        QSize(60, 60)))  # Specify size for pixmap
-                    # pixmap_loaded = True # Not strictly needed to set true here as it's a fallback
-                else:
-                    logger.warning(
-                        f"Default user icon (Icons.USER) could not be loaded or is null. Using theme placeholder for {self.faculty.name}.")
-                    fallback_pixmap = QPixmap(QSize(60, 60))
-                    fallback_pixmap.fill(QColor(self.theme.BG_SECONDARY))
-                    self.image_label.setPixmap(fallback_pixmap)
-            except Exception as e:
-                logger.error(
-                    f"Exception while trying to load default user icon for {self.faculty.name}: {str(e)}")
-                fallback_pixmap = QPixmap(QSize(60, 60))
-                fallback_pixmap.fill(QColor(self.theme.BG_SECONDARY))
-                self.image_label.setPixmap(fallback_pixmap)
+            self._image_cache_key = _faculty_image_cache_key(image_path)
+            if self._image_cache_key is None:
+                logger.warning(
+                    f"Could not load image for faculty {self.faculty.name} from provided path: {image_path} (not accessible)")
+            elif self.show_cached_image():
+                return
+
+        # Show the default avatar right away; the real image is decoded on a worker thread
+        self._set_default_image()
+
+        # Images already in a warm-start batch are applied by the dashboard when decoded
+        if self._image_cache_key and image_path not in _warming_image_paths:
+            loader = FacultyImageLoader([image_path], self.image_label.size(),
+                                        self.theme.BORDER_COLOR, self.theme.BG_PRIMARY)
+            loader.signals.loaded.connect(self._on_faculty_image_loaded)
+            _get_image_loader_pool().start(loader)
+
+    def show_cached_image(self):
+        """
+        Show the faculty image if it is in QPixmapCache.
+
+        Returns:
+            bool: True if the cached image was shown
+        """
+        if self._image_cache_key:
+            cached_pixmap = QPixmapCache.find(self._image_cache_key)
+            if cached_pixmap is not None and not cached_pixmap.isNull():
+                self.image_label.setPixmap(cached_pixmap)
+                return True
+        return False
+
+    def _on_faculty_image_loaded(self, image_path, image):
+        """
+        Apply a decoded faculty image. Runs on the UI thread.
+        """
+        # The card may have been deleted, or its faculty image changed, while decoding
+        if sip.isdeleted(self.image_label) or image_path != self._image_path:
+            return
+
+        if image.isNull():
+            logger.warning(
+                f"Could not load image for faculty {self.faculty.name} from provided path: {image_path} (image isNull)")
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(self._image_cache_key, pixmap)
+        self.image_label.setPixmap(pixmap)
+
+    def _set_default_image(self):
+        if FacultyCard._default_pixmap is None:
+            FacultyCard._default_pixmap = self._build_default_pixmap()
+        self.image_label.setPixmap(FacultyCard._default_pixmap)
+
+    def _build_default_pixmap(self):
+        size = QSize(60, 60)
+        try:
+            # Assuming IconProvider.get_icon returns a QIcon object
+            default_qicon = IconProvider.get_icon(Icons.USER)
+            if default_qicon and not default_qicon.isNull():
+                icon_image = default_qicon.pixmap(size).toImage()  # Specify size for pixmap
+                return QPixmap.fromImage(_make_circular_image(
+                    icon_image, size, self.theme.BORDER_COLOR, self.theme.BG_PRIMARY))
+            logger.warning(
+                "Default user icon (Icons.USER) could not be loaded or is null. Using theme placeholder.")
+        except Exception as e:
+            logger.error(f"Exception while trying to load default user icon: {str(e)}")
+
+        return QPixmap.fromImage(_make_circular_image(
+            QImage(), size, self.theme.BORDER_COLOR, self.theme.BG_SECONDARY))
+
+    @staticmethod
+    def _faculty_fingerprint(faculty):
+        """
+        Get the fields that determine what a card displays.
+        """
+        return (faculty.name, faculty.department, bool(faculty.status),
+                getattr(faculty, 'image_path', None))
 
     def update_faculty(self, faculty):
         """
         Update the faculty information efficiently.
+        Skips all widget work when the displayed fields are unchanged, and
+        otherwise updates only the widgets whose field changed.
         """
         self.faculty = faculty
-        self.name_label.setText(self.faculty.name)
-        self.dept_label.setText(self.faculty.department)
-        self._load_faculty_image()
+        if not self._hydrated:
+            return  # hydrate() builds the contents from the latest faculty
+        fingerprint = self._faculty_fingerprint(faculty)
+        if fingerprint == self._last_seen:
+            return
+        old_name, old_department, old_status, old_image_path = self._last_seen
+        name, department, status, image_path = fingerprint
+        self._last_seen = fingerprint
+
+        if name != old_name:
+            self.name_label.setText(name)
+        if department != old_department:
+            self.dept_label.setText(department)
+        if image_path != old_image_path:
+            self._load_faculty_image()
+        if status != old_status:
+            self.update_style_and_status()
+
+    def set_status(self, available):
+        """
+        Show a new availability reported by a status event, without waiting for the
+        faculty list to be reloaded.
+
+        Args:
+            available (bool): New availability
+        """
+        self.faculty.status = available
+        if not self._hydrated:
+            return  # hydrate() builds the contents from the updated faculty
+        name, department, _, image_path = self._last_seen
+        self._last_seen = (name, department, bool(available), image_path)
         self.update_style_and_status()
 
     def request_consultation(self):
@@ -249,13 +587,30 @@ class DashboardWindow(BaseWindow):
     """
     # Signal to handle consultation request
     consultation_requested = pyqtSignal(object, str, str)
+    # Emitted from the MQTT thread when a faculty status changes; delivered queued
+    faculty_status_changed = pyqtSignal(int, bool)
+
+    # Fallback logo pixmaps keyed by (width, height, rgba)
+    _fallback_cache = {}
 
     def __init__(self, student=None, parent=None):
         self.student = student  # Set self.student BEFORE calling super().__init__
-        self.theme = ConsultEaseTheme()  # Add theme instance
+        self.theme = THEME  # Shared theme instance
+        self._primary_qcolor = QColor(self.theme.PRIMARY_COLOR)  # Parsed once per theme
+        self._max_cols = None  # Grid columns that fit the viewport, updated on resize
+        self._laid_out_cols = None  # Column count the grid was last laid out with
+        # Splitter sizes kept in memory; QSettings is only written when they differ
+        self._cached_splitter_sizes = None  # Latest sizes, updated as the splitter moves
+        self._saved_splitter_sizes = None  # Sizes last written to or read from QSettings
         super().__init__(parent)  # Now BaseWindow.__init__ can call init_ui, which can access self.student
         # self.student = student # No longer needed here
 
+        # Coalesce history refreshes requested in quick succession into one
+        self._history_refresh_timer = QTimer(self)
+        self._history_refresh_timer.setSingleShot(True)
+        self._history_refresh_timer.setInterval(150)
+        self._history_refresh_timer.timeout.connect(self.consultation_panel.refresh_history)
+
         # Get controller instances (now singletons)
         self.faculty_controller = FacultyController.instance()
         self.consultation_controller = ConsultationController.instance()
@@ -273,20 +628,53 @@ class DashboardWindow(BaseWindow):
         self.no_results_label.setAlignment(Qt.AlignCenter)
         self.no_results_label.setVisible(False)
 
-        # Store faculty cards to manage them directly
-        self._faculty_card_map = {}  # Changed from _faculty_cards_widgets list to a map
+        # Card bookkeeping (_faculty_card_map etc.) is set up by init_ui via _reset_faculty_grid_state
+        # Unfiltered faculty list from the last timed refresh, used to filter in memory
+        self._all_faculty_cache = None
+        self._all_faculty_cache_time = 0.0
+        # Search index over the cached list, built on the first search after each load
+        self._faculty_search_index = None
+        # Hash of the (id, name, availability) rows behind the cached list
+        self._faculty_lite_fingerprint = None
+        # Id of the latest background faculty query; older results are dropped
+        self._faculty_query_id = 0
+        self._faculty_query_user_initiated = False
 
         # Initialize UI components - REMOVED as super().__init__ calls init_ui polymorphicly
         # self.init_ui()
 
-        # Set up auto-refresh timer for faculty status with further reduced frequency
+        # Status changes arrive over MQTT (see _on_faculty_status_changed); the timer is
+        # only a safety net for missed messages and edits made elsewhere
+        # Refresh intervals are resolved once here; the refresh path only reads these attributes
+        config = get_config()
+        self._base_refresh_interval = config.get('ui.dashboard_refresh_ms', 600000)
+        self._max_refresh_interval = config.get('ui.dashboard_max_refresh_ms', 1800000)
         self.refresh_timer = QTimer(self)
         self.refresh_timer.timeout.connect(self.refresh_faculty_status)
-        self.refresh_timer.start(get_config().get('ui.dashboard_refresh_ms', 120000))
+        self.refresh_timer.start(self._base_refresh_interval)
 
-        # Track consecutive no-change refreshes to further reduce refresh frequency when idle
+        # Track consecutive no-change refreshes to back off exponentially when idle
         self._consecutive_no_changes = 0
-        self._max_refresh_interval = get_config().get('ui.dashboard_max_refresh_ms', 300000)
+        self._last_status_hash = None
+        # Monotonic times of recent detected status changes, used to pace polling
+        self._change_times = deque(maxlen=200)
+
+        # MQTT status changes update the affected card directly
+        self.faculty_status_changed.connect(self._on_faculty_status_changed)
+        # Keep the exact bound emit that was registered so it can be unregistered later
+        self._faculty_status_callback = self.faculty_status_changed.emit
+        self.faculty_controller.register_callback(self._faculty_status_callback)
+        # Also unregister if the window is destroyed without being closed; the closure
+        # must not reference self, which is gone by the time destroyed fires
+        controller, callback = self.faculty_controller, self._faculty_status_callback
+        self.destroyed.connect(lambda: controller.unregister_callback(callback))
+
+        # Single debounced path for both user filtering and timed refreshes, so it is
+        # the only place that queries faculty
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.timeout.connect(self._perform_filter)
+        self._user_filter_pending = False
 
         # Log student info for debugging
         if student:
@@ -301,9 +689,18 @@ class DashboardWindow(BaseWindow):
         """
         Initialize the dashboard UI.
         """
+        # init_ui runs again when the student changes. The old central widget is deleted
+        # together with every card in it, so take the reusable no-results label out first.
+        if getattr(self, '_no_results_in_grid', False):
+            self.no_results_label.setVisible(False)
+            self.no_results_label.setParent(None)
+
         # Main layout
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
+        # The banner was a child of the old central widget, which has just been deleted;
+        # _show_banner creates a new one on the new widget when it is next needed
+        self._notification_banner = None
         main_layout = QVBoxLayout(main_widget)
         main_layout.setContentsMargins(20, 20, 20, 20)  # Overall padding
         main_layout.setSpacing(15)
@@ -501,7 +898,13 @@ class DashboardWindow(BaseWindow):
         self.faculty_grid_layout.setContentsMargins(
             15, 15, 15, 15)  # Padding within the scroll area content
         self.faculty_grid_layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        # Row/column currently given the trailing stretch, moved only when the grid shape changes
+        self._stretch_row = None
+        self._stretch_col = None
+        self._reset_faculty_grid_state()
         self.scroll_area.setWidget(self.faculty_cards_widget)
+        # Cards build their contents only once they scroll into view
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._hydrate_visible_cards)
         self.content_splitter.addWidget(self.scroll_area)
 
         # Right side: Consultation Panel
@@ -512,6 +915,14 @@ class DashboardWindow(BaseWindow):
             self.handle_consultation_cancel_feedback)
         self.content_splitter.addWidget(self.consultation_panel)
 
+        # The history refresh timer is created once in __init__ (after the first init_ui);
+        # on a rebuild, point it at the new panel since the old one was deleted
+        history_timer = getattr(self, '_history_refresh_timer', None)
+        if history_timer is not None:
+            history_timer.stop()
+            history_timer.timeout.disconnect()
+            history_timer.timeout.connect(self.consultation_panel.refresh_history)
+
         main_layout.addWidget(self.content_splitter, 1)  # Splitter takes remaining space
 
         # Restore splitter state or set defaults
@@ -519,12 +930,29 @@ class DashboardWindow(BaseWindow):
         default_left_width = int(screen_width * 0.62)
         default_right_width = int(screen_width * 0.38)
         self.restore_splitter_state(default_sizes=[default_left_width, default_right_width])
-        self.content_splitter.splitterMoved.connect(self.save_splitter_state)
+        self.content_splitter.splitterMoved.connect(self._cache_splitter_sizes)
+        self.content_splitter.splitterMoved.connect(self._update_grid_columns)
 
         # Temporary manual RFID entry - consider moving to a more appropriate place or dialog
         # ... (manual RFID input commented out as per previous state, can be restyled if re-added)
 
-        QTimer.singleShot(100, self._scroll_faculty_to_top)
+        # Zero-delay so it runs right after the pending layout pass, not after an arbitrary wait
+        QTimer.singleShot(0, self._scroll_faculty_to_top)
+
+    def _reset_faculty_grid_state(self):
+        """
+        Forget the cards laid out in the previous grid widget.
+        Called whenever init_ui builds a new, empty faculty grid.
+        """
+        self._faculty_card_map = {}  # Changed from _faculty_cards_widgets list to a map
+        self._ordered_ids = []  # Faculty IDs in the order currently laid out
+        self._grid_positions = {}  # Faculty ID -> (row, col) of cards currently in the grid
+        self._no_results_in_grid = False
+        self._laid_out_cols = None
+        self._max_cols = None  # Recomputed from the new scroll area on the next populate
+        # (count, xor, sum) fingerprint of the faculty list currently shown in the grid;
+        # cleared so the next refresh fills the new grid even if the data is unchanged
+        self._current_faculty_fingerprint = None
 
     def populate_faculty_grid(self, faculties):
         """
@@ -540,102 +968,291 @@ class DashboardWindow(BaseWindow):
             self.loading_label.setVisible(False)
             self.no_results_label.setVisible(False)
 
-            new_faculty_ids = {f.id for f in faculties}
+            if self._max_cols is None:
+                self._max_cols = self._compute_max_cols()
+
+            # Fast path: same faculty in the same order and column count, so only
+            # card contents can differ
+            new_ordered_ids = [f.id for f in faculties]
+            if (self._faculty_card_map and new_ordered_ids == self._ordered_ids
+                    and self._laid_out_cols == self._max_cols):
+                for faculty in faculties:
+                    card = self._faculty_card_map[faculty.id]
+                    if card.faculty is not faculty:
+                        card.update_faculty(faculty)
+                return
+            self._ordered_ids = new_ordered_ids
+
+            new_faculty_ids = set(new_ordered_ids)
             current_map_ids = set(self._faculty_card_map.keys())
 
-            # Remove cards for faculty no longer present
+            # Remove cards for faculty no longer present. Cards that are only filtered
+            # out are hidden and kept, so clearing the search does not rebuild them.
+            cached_ids = ({f.id for f in self._all_faculty_cache}
+                          if self._all_faculty_cache is not None else set())
             ids_to_remove = current_map_ids - new_faculty_ids
             for faculty_id in ids_to_remove:
-                card_to_delete = self._faculty_card_map.pop(faculty_id)
-                if card_to_delete:  # Ensure it exists
-                    self.faculty_grid_layout.removeWidget(card_to_delete)
-                    card_to_delete.deleteLater()
-
-            # Update existing cards and create new ones
-            ordered_cards_for_layout = []
+                card = self._faculty_card_map[faculty_id]
+                if self._grid_positions.pop(faculty_id, None) is not None:
+                    self.faculty_grid_layout.removeWidget(card)
+                if faculty_id in cached_ids:
+                    card.setVisible(False)
+                else:
+                    del self._faculty_card_map[faculty_id]
+                    card.deleteLater()
+
+            # Update existing cards and create new ones. Signals are connected only when
+            # a card is created; existing cards keep their connection across refreshes.
+            # Cards already showing this exact faculty object (a re-filter of the cached
+            # list) are skipped, so only added and reloaded faculty are touched.
+            new_cards = []
             for faculty in faculties:
                 if faculty.id in self._faculty_card_map:
                     card = self._faculty_card_map[faculty.id]
-                    card.update_faculty(faculty)
+                    if card.faculty is not faculty:
+                        card.update_faculty(faculty)
                 else:
                     card = FacultyCard(faculty)
                     card.consultation_requested.connect(self.show_consultation_form_for_faculty)
                     self._faculty_card_map[faculty.id] = card
-                ordered_cards_for_layout.append(card)
-
-            # Clear current layout (widgets are managed by _faculty_card_map now)
-            # Detach widgets from layout without deleting them if they are in
-            # ordered_cards_for_layout
-            current_widgets_in_layout = []
-            for i in reversed(range(self.faculty_grid_layout.count())):
-                item = self.faculty_grid_layout.itemAt(i)
-                if item and item.widget():
-                    widget = item.widget()
-                    current_widgets_in_layout.append(widget)
-                    # Detach by setting parent to None, or removeWidget.
-                    # removeWidget also sets parent to None if widget is child of layout's parent.
-                    self.faculty_grid_layout.removeWidget(widget)
-                    # widget.setParent(None) # Alternative, if removeWidget isn't enough
-                    # Do not deleteLater here if it's an FacultyCard we might re-add
-
-            # Re-populate the grid with the ordered cards
-            if not ordered_cards_for_layout:
-                self.faculty_grid_layout.addWidget(
-                    self.no_results_label, 0, 0, 1, 1, Qt.AlignCenter)  # Span if max_cols known
+                    new_cards.append(card)
+            # Decode the new cards' images in one background sweep, before any of
+            # them is hydrated, so scrolling finds them in QPixmapCache
+            self._warm_image_cache(new_cards)
+
+            if not faculties:
+                if not self._no_results_in_grid:
+                    self.faculty_grid_layout.addWidget(
+                        self.no_results_label, 0, 0, 1, 1, Qt.AlignCenter)  # Span if max_cols known
+                    self._no_results_in_grid = True
                 self.no_results_label.setVisible(True)
-            else:
-                scroll_area_width = self.scroll_area.viewport().width() if self.scroll_area.viewport() else 600
-                card_plus_spacing = 260 + self.faculty_grid_layout.spacing()
-                max_cols = max(1, int(scroll_area_width / card_plus_spacing))
-
-                row, col = 0, 0
-                for card in ordered_cards_for_layout:
-                    # Ensure widget is not already in a layout if removeWidget didn't reparent it fully.
-                    # Or, ensure it's properly parented to self.faculty_cards_widget
-                    if card.parent() != self.faculty_cards_widget:  # Check if it needs reparenting
-                        # Ensure correct parent for layout
-                        card.setParent(self.faculty_cards_widget)
-
-                    self.faculty_grid_layout.addWidget(card, row, col)
-                    card.setVisible(True)  # Ensure it's visible if it was hidden
-                    col += 1
-                    if col >= max_cols:
-                        col = 0
-                        row += 1
-
-                # Add stretch to fill remaining space
-                if ordered_cards_for_layout:
-                    self.faculty_grid_layout.setRowStretch(row + 1, 1)
-                    self.faculty_grid_layout.setColumnStretch(
-                        max_cols, 1)  # Stretch column beyond last item if not full
+                return
+
+            if self._no_results_in_grid:
+                self.faculty_grid_layout.removeWidget(self.no_results_label)
+                self._no_results_in_grid = False
+
+            max_cols = self._max_cols
+            self._laid_out_cols = max_cols
+
+            # Only cards whose grid cell changed are moved; cards already in the right
+            # cell are left in place. Moved cards are detached first so no two cards
+            # share a cell while the grid is being rearranged.
+            moved = []
+            for index, faculty_id in enumerate(new_ordered_ids):
+                position = divmod(index, max_cols)
+                if self._grid_positions.get(faculty_id) != position:
+                    card = self._faculty_card_map[faculty_id]
+                    if faculty_id in self._grid_positions:
+                        self.faculty_grid_layout.removeWidget(card)
+                    moved.append((card, position))
+                    self._grid_positions[faculty_id] = position
+
+            for card, (row, col) in moved:
+                if card.parent() != self.faculty_cards_widget:  # Check if it needs reparenting
+                    # Ensure correct parent for layout
+                    card.setParent(self.faculty_cards_widget)
+                self.faculty_grid_layout.addWidget(card, row, col)
+                card.setVisible(True)  # Ensure it's visible if it was hidden
+
+            # Stretch the row and column after the last card to fill remaining space.
+            # The previous stretch is cleared so stretches do not accumulate.
+            stretch_row = (len(new_ordered_ids) - 1) // max_cols + 1
+            if stretch_row != self._stretch_row:
+                if self._stretch_row is not None:
+                    self.faculty_grid_layout.setRowStretch(self._stretch_row, 0)
+                self.faculty_grid_layout.setRowStretch(stretch_row, 1)
+                self._stretch_row = stretch_row
+            if max_cols != self._stretch_col:
+                if self._stretch_col is not None:
+                    self.faculty_grid_layout.setColumnStretch(self._stretch_col, 0)
+                # Stretch column beyond last item if not full
+                self.faculty_grid_layout.setColumnStretch(max_cols, 1)
+                self._stretch_col = max_cols
 
         finally:
             self.setUpdatesEnabled(True)
-            self.faculty_cards_widget.adjustSize()  # Adjust size of the container for the grid
+            # Let the layout invalidate lazily; adjustSize() would force an immediate extra pass
+            self.faculty_cards_widget.updateGeometry()
+            # Card geometry is final after the pending layout pass
+            QTimer.singleShot(0, self._hydrate_visible_cards)
             # QApplication.processEvents() # Usually not needed if
             # updatesEnabled(True) is handled correctly
 
+    def _compute_max_cols(self):
+        """
+        Get the number of faculty card columns that fit in the scroll area viewport.
+        """
+        scroll_area_width = self.scroll_area.viewport().width() if self.scroll_area.viewport() else 600
+        card_plus_spacing = 260 + self.faculty_grid_layout.spacing()
+        return max(1, scroll_area_width // card_plus_spacing)
+
+    def _update_grid_columns(self):
+        """
+        Re-lay out the faculty grid if the number of columns that fit has changed.
+        """
+        max_cols = self._compute_max_cols()
+        if max_cols != self._max_cols:
+            self._max_cols = max_cols
+            if self._ordered_ids:
+                self.populate_faculty_grid(
+                    [self._faculty_card_map[faculty_id].faculty for faculty_id in self._ordered_ids])
+        # More of the grid may be visible now
+        QTimer.singleShot(0, self._hydrate_visible_cards)
+
+    def resizeEvent(self, event):
+        """
+        Recompute the grid column count when the window is resized.
+        """
+        super().resizeEvent(event)
+        if hasattr(self, 'scroll_area') and hasattr(self, '_ordered_ids'):
+            self._update_grid_columns()
+
+    def _warm_image_cache(self, cards):
+        """
+        Decode the images of the given cards in a single background batch and
+        store them in QPixmapCache.
+
+        Args:
+            cards (list): Newly created FacultyCard widgets
+        """
+        FacultyCard.ensure_pixmap_cache_limit()
+        image_paths = []
+        for card in cards:
+            faculty = card.faculty
+            image_path = faculty.get_image_path() if hasattr(faculty, 'get_image_path') else None
+            if not image_path or image_path in _warming_image_paths:
+                continue
+            cache_key = _faculty_image_cache_key(image_path)
+            if cache_key is None:
+                continue
+            cached_pixmap = QPixmapCache.find(cache_key)
+            if cached_pixmap is not None and not cached_pixmap.isNull():
+                continue
+            _warming_image_paths.add(image_path)
+            image_paths.append(image_path)
+
+        if image_paths:
+            loader = FacultyImageLoader(image_paths, QSize(60, 60),
+                                        self.theme.BORDER_COLOR, self.theme.BG_PRIMARY)
+            loader.signals.loaded.connect(self._on_warm_image_loaded)
+            _get_image_loader_pool().start(loader)
+
+    def _on_warm_image_loaded(self, image_path, image):
+        """
+        Cache an image decoded by the warm-start batch and show it on any card
+        already waiting for it. Runs on the UI thread.
+        """
+        _warming_image_paths.discard(image_path)
+        if image.isNull():
+            logger.warning(f"Could not load faculty image from provided path: {image_path} (image isNull)")
+            return
+        cache_key = _faculty_image_cache_key(image_path)
+        if cache_key is None:
+            return
+
+        QPixmapCache.insert(cache_key, QPixmap.fromImage(image))
+        for card in self._faculty_card_map.values():
+            if card.is_hydrated() and card._image_path == image_path:
+                card.show_cached_image()
+
+    def _hydrate_visible_cards(self):
+        """
+        Build the contents of cards that intersect the scroll area viewport.
+        """
+        viewport = self.scroll_area.viewport()
+        # Visible region in faculty_cards_widget coordinates, plus half a page ahead
+        visible_rect = viewport.rect().translated(
+            0, self.scroll_area.verticalScrollBar().value()).adjusted(
+            0, 0, 0, viewport.height() // 2)
+
+        for card in self._faculty_card_map.values():
+            if (not card.is_hydrated() and not card.isHidden()
+                    and card.geometry().intersects(visible_rect)):
+                card.hydrate()
+
     def filter_faculty(self):
         """
         Filter faculty grid based on search text and filter selection.
         Uses a debounce mechanism to prevent excessive updates.
         """
-        # Cancel any pending filter operation
-        if hasattr(self, '_filter_timer') and self._filter_timer.isActive():
-            self._filter_timer.stop()
+        self._user_filter_pending = True
+        # (Re)start the timer - will trigger _perform_filter after 300ms
+        self._schedule_refresh(300)
+
+    def _perform_filter(self):
+        """
+        Update the grid for the current search text and filter selection.
+        Shared by user filtering and the periodic refresh. Search typing is answered
+        from the cached faculty list while it is fresh; otherwise the list is
+        reloaded on a worker thread and applied when it arrives.
+        """
+        user_initiated = self._user_filter_pending
+        self._user_filter_pending = False
+
+        # Searches accept a cache up to one refresh interval old; refreshes only
+        # within the cache TTL. Both are bounded by invalidate_faculty_cache().
+        max_age_ms = self._base_refresh_interval if user_initiated else _FACULTY_CACHE_TTL_MS
+        if self._all_faculty_cache is not None and self._faculty_cache_age_ms() < max_age_ms:
+            self._apply_faculty_filter(user_initiated)
+            return
 
-        # Create a new timer for debouncing
-        if not hasattr(self, '_filter_timer'):
-            self._filter_timer = QTimer(self)
-            self._filter_timer.setSingleShot(True)
-            self._filter_timer.timeout.connect(self._perform_filter)
+        # Stale cache: reload the full list from the database
+        self._faculty_query_id += 1
+        self._faculty_query_user_initiated = user_initiated
+        loader = FacultyListLoader(self._faculty_query_id, self.faculty_controller,
+                                   self._faculty_lite_fingerprint)
+        loader.signals.loaded.connect(self._on_faculty_list_loaded)
+        loader.signals.unchanged.connect(self._on_faculty_list_unchanged)
+        loader.signals.failed.connect(self._on_faculty_list_failed)
+        QThreadPool.globalInstance().start(loader)
+
+    def _faculty_cache_age_ms(self):
+        """
+        Get the age of the cached faculty list in milliseconds.
+        """
+        return (time.monotonic() - self._all_faculty_cache_time) * 1000
+
+    def _on_faculty_list_loaded(self, query_id, faculties, fingerprint):
+        """
+        Cache a faculty list loaded in the background and update the grid.
+        Runs on the UI thread.
+        """
+        if query_id != self._faculty_query_id:
+            return  # Superseded by a newer query
 
-        # Start the timer - will trigger _perform_filter after 300ms
-        self._filter_timer.start(300)
+        self._all_faculty_cache = faculties
+        self._all_faculty_cache_time = time.monotonic()
+        self._faculty_lite_fingerprint = fingerprint
+        self._faculty_search_index = None
+        self._apply_faculty_filter(self._faculty_query_user_initiated)
 
-    def _perform_filter(self):
+    def _on_faculty_list_unchanged(self, query_id):
+        """
+        Keep using the cached faculty list after the background check found no
+        changes. Runs on the UI thread.
+        """
+        if query_id != self._faculty_query_id:
+            return
+
+        self._all_faculty_cache_time = time.monotonic()
+        self._apply_faculty_filter(self._faculty_query_user_initiated)
+
+    def _on_faculty_list_failed(self, query_id, error):
+        """
+        Report a failed background faculty query. Runs on the UI thread.
+        """
+        if query_id != self._faculty_query_id:
+            return
+        self._report_refresh_error(error, self._faculty_query_user_initiated)
+
+    def _apply_faculty_filter(self, user_initiated):
         """
-        Actually perform the faculty filtering after debounce delay.
+        Filter the cached faculty list and update the grid if anything changed.
+        Implements adaptive refresh rate based on activity.
+
+        Args:
+            user_initiated (bool): Whether the update was triggered by the user
         """
         try:
             search_text = self.search_bar.text().strip().lower()
@@ -648,104 +1265,193 @@ class DashboardWindow(BaseWindow):
             elif filter_value == "unavailable":
                 filter_available_bool = False
 
-            faculties = self.faculty_controller.get_all_faculty(
-                filter_available=filter_available_bool,
-                search_term=search_text
-            )
+            faculties = self._filter_cached_faculty(search_text, filter_available_bool)
+
+            if user_initiated:
+                self._reset_refresh_backoff()
+            else:
+                self._update_refresh_backoff(self._all_faculty_cache)
+
+            # Compare an order-insensitive fingerprint so no per-faculty data is kept
+            # or compared. A mismatch always goes through the real diff in
+            # populate_faculty_grid, so a false mismatch only costs time.
+            fingerprint = self._faculty_list_fingerprint(faculties)
+            if fingerprint == self._current_faculty_fingerprint:
+                return
+
+            self._current_faculty_fingerprint = fingerprint
             self.populate_faculty_grid(faculties)
-            self._current_faculty_data = self._extract_faculty_data(faculties)
         except Exception as e:
-            logger.error(f"Error filtering faculty: {str(e)}")
-            self.show_notification("Error filtering faculty list", "error")
+            self._report_refresh_error(str(e), user_initiated)
 
-    def refresh_faculty_status(self):
+    def _report_refresh_error(self, error, user_initiated):
         """
-        Refresh the faculty status from the server with optimizations to reduce loading indicators.
-        Implements adaptive refresh rate based on activity.
+        Log a faculty refresh error and notify the user when appropriate.
+
+        Args:
+            error (str): Error message
+            user_initiated (bool): Whether the refresh was triggered by the user
         """
-        try:
-            # Show loading label if it's the first load or a significant delay is expected
-            # For now, relying on fast updates, but could add
-            # self.loading_label.setVisible(True) here
+        logger.error(f"Error refreshing faculty list: {error}")
+        if user_initiated:
+            self.show_notification("Error filtering faculty list", "error")
+        elif "Connection refused" in error or "Database error" in error:
+            self.show_notification(
+                "Error refreshing faculty status. Check connection.", "error")
+        self._consecutive_no_changes = 0
 
-            search_text = self.search_bar.text().strip().lower()
-            filter_value = self.filter_combo.currentData()
-            filter_available_bool = None
-            if filter_value == "available":
-                filter_available_bool = True
-            elif filter_value == "unavailable":
-                filter_available_bool = False
+    def _update_refresh_backoff(self, faculties):
+        """
+        Lengthen the refresh interval, up to the configured maximum, for each timed
+        refresh that finds no faculty status changes.
 
-            faculties = self.faculty_controller.get_all_faculty(
-                filter_available=filter_available_bool,
-                search_term=search_text
-            )
+        Once a few status changes have been seen, the time between changes is
+        modelled as exponential and the interval is its median, ln(2) / rate, so
+        polls land where a change is as likely as not to have happened. Until then
+        the interval doubles for each unchanged refresh.
 
-            current_data_snapshot = self._extract_faculty_data(faculties)
-            if hasattr(self, '_current_faculty_data') and set(
-                    self._current_faculty_data) == set(current_data_snapshot):
-                self._consecutive_no_changes += 1
-                logger.debug(
-                    f"No faculty status changes detected ({self._consecutive_no_changes} consecutive).")
-                if self._consecutive_no_changes >= 3 and self.refresh_timer.interval() < self._max_refresh_interval:
-                    new_interval = min(
-                        self.refresh_timer.interval() + 60000,
-                        self._max_refresh_interval)
-                    self.refresh_timer.setInterval(new_interval)
-                    logger.debug(f"Reduced refresh frequency to {new_interval/1000}s.")
-                # self.loading_label.setVisible(False) # Hide loading if it was shown
-                return
+        Args:
+            faculties (list): Full faculty list returned by the refresh
+        """
+        status_hash = hash(tuple((f.id, bool(f.status)) for f in faculties))
+        if status_hash != self._last_status_hash:
+            if self._last_status_hash is not None:
+                self._change_times.append(time.monotonic())
+            self._last_status_hash = status_hash
+            self._reset_refresh_backoff()
+            return
 
-            self._consecutive_no_changes = 0
-            if self.refresh_timer.interval() > get_config().get('ui.dashboard_refresh_ms', 120000):
-                self.refresh_timer.setInterval(get_config().get('ui.dashboard_refresh_ms', 120000))
-                logger.debug("Restored normal refresh rate.")
+        self._consecutive_no_changes += 1
+        if len(self._change_times) >= 3:
+            mean_gap_ms = ((self._change_times[-1] - self._change_times[0])
+                           / (len(self._change_times) - 1) * 1000)
+            new_interval = int(math.log(2) * mean_gap_ms)
+        else:
+            new_interval = self._base_refresh_interval * 2 ** min(self._consecutive_no_changes, 5)
+        new_interval = max(self._base_refresh_interval,
+                           min(self._max_refresh_interval, new_interval))
+        if new_interval != self.refresh_timer.interval():
+            self.refresh_timer.setInterval(new_interval)
+            logger.debug(
+                f"No faculty status changes detected ({self._consecutive_no_changes} consecutive). "
+                f"Reduced refresh frequency to {new_interval/1000}s.")
+
+    def _on_faculty_status_changed(self, faculty_id, available):
+        """
+        Handle a faculty status change reported over MQTT.
+        The faculty's card is updated in place; the grid is only reloaded when the
+        change can add or remove cards under the current filter.
 
-            self._current_faculty_data = current_data_snapshot
-            self.populate_faculty_grid(faculties)
-            # self.loading_label.setVisible(False)
+        Args:
+            faculty_id (int): ID of the faculty member whose status changed
+            available (bool): New availability
+        """
+        card = self._faculty_card_map.get(faculty_id)
+        if card is not None and bool(card.faculty.status) == available:
+            return  # Repeated report of the status already shown
+
+        logger.debug(f"Faculty {faculty_id} status changed to available={available}.")
+        if card is not None:
+            card.set_status(available)
+        # The cached list no longer matches the database
+        self.invalidate_faculty_cache()
+        self._reset_refresh_backoff()
+        if card is None or self.filter_combo.currentData() != "all":
+            self.refresh_faculty_status()
+
+    def invalidate_faculty_cache(self):
+        """
+        Mark the cached faculty list stale so the next refresh or search reloads it.
+        Call after faculty data is changed outside the dashboard.
+        """
+        self._all_faculty_cache_time = 0.0
+        # The lightweight check does not cover every field, so force a full load
+        self._faculty_lite_fingerprint = None
 
-            # Less frequent history refresh, handled by ConsultationPanel itself now
-        except Exception as e:
-            logger.error(f"Error refreshing faculty status: {str(e)}")
-            # self.loading_label.setVisible(False)
-            if "Connection refused" in str(e) or "Database error" in str(e):
-                self.show_notification(
-                    "Error refreshing faculty status. Check connection.", "error")
-            self._consecutive_no_changes = 0
+    def _reset_refresh_backoff(self):
+        """
+        Restore the normal refresh rate after user interaction or a status change.
+        """
+        self._consecutive_no_changes = 0
+        if self.refresh_timer.interval() != self._base_refresh_interval:
+            self.refresh_timer.setInterval(self._base_refresh_interval)
+            logger.debug("Restored normal refresh rate.")
+
+    def reset_filters(self):
+        """
+        Clear the search text and availability filter without triggering a refresh.
+        Signals are blocked so programmatic changes do not start the filter timer.
+        """
+        with QSignalBlocker(self.search_bar):
+            self.search_bar.setText("")
+        with QSignalBlocker(self.filter_combo):
+            self.filter_combo.setCurrentIndex(0)
 
-    def _extract_faculty_data(self, faculties):
+    def _filter_cached_faculty(self, search_text, filter_available):
         """
-        Extract relevant data from faculty objects for comparison.
+        Filter the cached faculty list by search text and availability.
 
         Args:
-            faculties (list): List of faculty objects
+            search_text (str): Lower-case text to match against name or department
+            filter_available (bool): Required availability, or None for any
 
         Returns:
-            list: List of tuples with faculty ID, name, and status
+            list: Matching faculty objects in cache order
+        """
+        matches = None
+        if search_text:
+            if self._faculty_search_index is None:
+                self._faculty_search_index = SubstringIndex(
+                    [f"{f.name}\x00{f.department}" for f in self._all_faculty_cache])
+            matches = self._faculty_search_index.match(search_text)
+        return [
+            f for i, f in enumerate(self._all_faculty_cache)
+            if (filter_available is None or bool(f.status) == filter_available)
+            and (matches is None or matches[i])
+        ]
+
+    def refresh_faculty_status(self):
         """
-        return [(f.id, f.name, f.status) for f in faculties]
+        Refresh the faculty status from the server.
+        Runs through the debounced filter path so a refresh that coincides with
+        typing results in a single query.
+        """
+        self._schedule_refresh()
 
-    def _compare_faculty_data(self, old_data, new_faculties):
+    def _schedule_refresh(self, delay_ms=100):
         """
-        Compare old and new faculty data to detect changes.
+        Run _perform_filter once after delay_ms. Every caller goes through the same
+        single-shot timer, so refresh requests arriving within the delay (a status
+        event, a filter change, the periodic timer) are coalesced into one update.
 
         Args:
-            old_data (list): Previous faculty data
-            new_faculties (list): New faculty objects
+            delay_ms (int): Delay before the update; restarted by each call
+        """
+        self._filter_timer.start(delay_ms)
 
-        Returns:
-            bool: True if data is the same, False if there are changes
+    @staticmethod
+    def _faculty_list_fingerprint(faculties):
         """
-        # Extract data from new faculty objects
-        new_data = self._extract_faculty_data(new_faculties)
+        Summarize the displayed data of a faculty list for change detection.
 
-        # Quick length check
-        if len(old_data) != len(new_data):
-            return False
+        The XOR and the 64-bit sum of each faculty's (ID, name, status) hash are
+        independent, so a changed list would have to collide in both, at the same
+        length, to be missed. The count also catches additions and removals that
+        cancel out in the XOR.
+
+        Args:
+            faculties (list): List of faculty objects
 
-        # Convert to sets for comparison (ignoring order)
-        return set(old_data) == set(new_data)
+        Returns:
+            tuple: (count, XOR of hashes, sum of hashes modulo 2**64)
+        """
+        count = fp_xor = fp_sum = 0
+        for f in faculties:
+            h = hash((f.id, f.name, bool(f.status)))
+            count += 1
+            fp_xor ^= h
+            fp_sum += h
+        return count, fp_xor, fp_sum & 0xFFFFFFFFFFFFFFFF
 
     def show_consultation_form_for_faculty(self, faculty):
         """
@@ -766,28 +1472,36 @@ class DashboardWindow(BaseWindow):
         try:
             logger.info(f"Showing consultation form for faculty: {faculty.name}")
 
-            # Load available faculty for the dropdown
-            available_faculty = self.faculty_controller.get_all_faculty(
-                filter_available=True)  # Or get all faculty if selection should be wider
+            # Reuse the dashboard's faculty list while it is fresh; otherwise load all
+            # faculty once. The available subset is derived in Python either way.
+            if self._all_faculty_cache and self._faculty_cache_age_ms() < self._base_refresh_interval:
+                all_faculty = self._all_faculty_cache
+            else:
+                all_faculty = self.faculty_controller.get_all_faculty()
+            if not all_faculty:  # Should not happen if DB has faculty
+                self.show_notification("No faculty found in the system.", "error")
+                return
+
+            available_faculty = [f for f in all_faculty if f.status]
             if not available_faculty:
                 logger.warning("No faculty available for consultation form dropdown.")
                 # Keep a list of all faculty as a fallback, even if unavailable, they can be selected
                 # but the form itself should prevent submission if they are not truly available.
-                all_faculty = self.faculty_controller.get_all_faculty()
-                if not all_faculty:  # Should not happen if DB has faculty
-                    NotificationManager.show_message(
-                        self, "Error", "No faculty found in the system.", NotificationManager.ERROR)
-                    return
-                # Use all as fallback, form will handle availability check.
                 available_faculty = all_faculty
 
-            # Pass the specific faculty and the list of available faculty to the panel
-            self.consultation_panel.set_faculty_options(available_faculty)
-            self.consultation_panel.set_faculty(faculty)
-            self.consultation_panel.animate_tab_change(0)  # Switch to the request form tab
-
-            # Ensure the consultation panel is visible and focused
-            self.consultation_panel.setVisible(True)
+            # Pass the specific faculty and the list of available faculty to the panel.
+            # Updates are suspended so the panel repaints once instead of per call.
+            self.consultation_panel.setUpdatesEnabled(False)
+            try:
+                self.consultation_panel.set_faculty_options(available_faculty)
+                # Switch to the request form tab directly; the user asked for the form,
+                # so the tab animation only adds latency here
+                self.consultation_panel.set_faculty(faculty, animate=False)
+
+                # Ensure the consultation panel is visible and focused
+                self.consultation_panel.setVisible(True)
+            finally:
+                self.consultation_panel.setUpdatesEnabled(True)
         except Exception as e:
             logger.error(f"Error loading available faculty for consultation form: {str(e)}")
             self.show_notification("Error preparing consultation form.", "error")
@@ -808,17 +1522,17 @@ class DashboardWindow(BaseWindow):
         # This handler in DashboardWindow is now primarily for user feedback.
 
         try:
-            # Show confirmation message
-            QMessageBox.information(
-                self,
-                "Consultation Request",
-                f"Your consultation request with {consultation.faculty.name} has been submitted."
+            # Show a non-blocking confirmation so the event loop keeps running
+            self._show_banner(
+                f"Your consultation request with {consultation.faculty.name} has been submitted.",
+                NotificationBanner.SUCCESS
             )
 
             # Ensure the consultation panel (which contains the history) is refreshed
             # This might be redundant if ConsultationPanel already refreshes its history tab
             # after successful submission, but ensures consistency.
-            self.consultation_panel.refresh_history()
+            # Deferred and coalesced so rapid submissions trigger a single refresh.
+            self._history_refresh_timer.start()
 
         except Exception as e:
             # This exception handling might be for cases where faculty object is malformed for the message string,
@@ -845,37 +1559,68 @@ class DashboardWindow(BaseWindow):
         else:
             QMessageBox.warning(self, "Cancellation Failed", message)
 
+    def _cache_splitter_sizes(self):
+        """
+        Remember the splitter sizes while it is dragged; written out by save_splitter_state().
+        """
+        self._cached_splitter_sizes = tuple(self.content_splitter.sizes())
+
     def save_splitter_state(self):
         """
-        Save the current splitter state to settings.
+        Save the current splitter state to settings if it changed since the last save.
         """
+        sizes = tuple(self.content_splitter.sizes())
+        self._cached_splitter_sizes = sizes
+        if sizes == self._saved_splitter_sizes:
+            return
         settings = QSettings("ConsultEase", "DashboardWindow")
-        settings.setValue("splitterSizes", self.content_splitter.sizes())
-        logger.debug(f"Saved splitter sizes: {self.content_splitter.sizes()}")
+        settings.setValue("splitterSizes", list(sizes))
+        self._saved_splitter_sizes = sizes
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Saved splitter sizes: {sizes}")
 
     def restore_splitter_state(self, default_sizes=None):
         """
-        Restore the splitter state from settings.
+        Restore the splitter state, from memory if this window already has it,
+        otherwise from settings.
         """
         if default_sizes is None:
             default_sizes = [600, 400]
+
+        if self._cached_splitter_sizes is not None:
+            self.content_splitter.setSizes(list(self._cached_splitter_sizes))
+            return
+
         settings = QSettings("ConsultEase", "DashboardWindow")
-        sizes = settings.value("splitterSizes", default_sizes, type=list)
-        # Ensure sizes are integers
+        sizes = settings.value("splitterSizes", default_sizes, type=list) or default_sizes
         try:
-            sizes = [int(s) for s in sizes]
-            if len(sizes) == 2 and all(isinstance(s, int)
-                                       for s in sizes) and sum(sizes) > 100:  # Basic sanity check
-                self.content_splitter.setSizes(sizes)
-                logger.debug(f"Restored splitter sizes: {sizes}")
-            else:
-                logger.warning(
-                    f"Invalid splitter sizes from settings: {sizes}. Using defaults: {default_sizes}")
-                self.content_splitter.setSizes(default_sizes)
-        except Exception as e:
-            logger.error(
-                f"Error restoring splitter state (sizes: {sizes}): {e}. Using defaults: {default_sizes}")
-            self.content_splitter.setSizes(default_sizes)
+            left, right = map(int, sizes)
+            valid = (left + right) > 100  # Basic sanity check
+        except (TypeError, ValueError):
+            valid = False
+
+        final_sizes = default_sizes
+        if valid:
+            final_sizes = [left, right]
+            self._saved_splitter_sizes = (left, right)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Restored splitter sizes: {final_sizes}")
+        else:
+            logger.warning(
+                f"Invalid splitter sizes from settings: {sizes}. Using defaults: {default_sizes}")
+
+        # Single exit point so the splitter is resized exactly once
+        self.content_splitter.setSizes(final_sizes)
+        self._cached_splitter_sizes = tuple(final_sizes)
+
+    def closeEvent(self, event):
+        """
+        Save the splitter state and stop receiving faculty status changes
+        when the window closes.
+        """
+        self.save_splitter_state()
+        self.faculty_controller.unregister_callback(self._faculty_status_callback)
+        super().closeEvent(event)
 
     def logout(self):
         """
@@ -884,6 +1629,9 @@ class DashboardWindow(BaseWindow):
         # Save splitter state before logout
         self.save_splitter_state()
 
+        # Next student starts with an unfiltered faculty list
+        self.reset_filters()
+
         self.change_window.emit("login", None)
 
     def show_notification(self, message, message_type="info"):
@@ -894,42 +1642,43 @@ class DashboardWindow(BaseWindow):
             message (str): Message to display
             message_type (str): Type of message ('success', 'error', 'warning', or 'info')
         """
-        try:
-            # Get standardized message type
-            std_type = NotificationManager.get_standardized_type(message_type)
+        if _HAS_NM:
+            # Get standardized message type (precomputed for the common types)
+            std_type = _STD_TYPE.get(message_type) or NotificationManager.get_standardized_type(
+                message_type)
 
             # Show notification using the manager
-            title = message_type.capitalize()
-            if message_type == "error":
-                title = "Error"
-            elif message_type == "success":
-                title = "Success"
-            elif message_type == "warning":
-                title = "Warning"
-            else:
-                title = "Information"
+            title = _TITLE_MAP.get(message_type, "Information")
 
             NotificationManager.show_message(self, title, message, std_type)
+        else:
+            # Fallback to a non-modal banner if notification manager is not available
+            logger.warning("NotificationManager not available, using notification banner")
+            self._show_banner(message, message_type)
 
-        except ImportError:
-            # Fallback to basic message boxes if notification manager is not available
-            logger.warning("NotificationManager not available, using basic message boxes")
-            if message_type == "success":
-                QMessageBox.information(self, "Success", message)
-            elif message_type == "error":
-                QMessageBox.warning(self, "Error", message)
-            elif message_type == "warning":
-                QMessageBox.warning(self, "Warning", message)
-            else:
-                QMessageBox.information(self, "Information", message)
+    def _show_banner(self, message, message_type=NotificationBanner.INFO, timeout=3000):
+        """
+        Show a non-modal notification banner that hides itself after a timeout.
+
+        Args:
+            message (str): Message to display
+            message_type (str): Banner type ('success', 'error', 'warning', or 'info')
+            timeout (int): Time in ms before auto-hiding
+        """
+        if self._notification_banner is None:
+            self._notification_banner = NotificationBanner(self.centralWidget())
+        self._notification_banner.raise_()
+        self._notification_banner.show_message(message, message_type, timeout)
 
     def _scroll_faculty_to_top(self):
         """
         Scroll the faculty grid to the top.
         This is called after the UI is fully loaded to ensure faculty cards are visible.
         """
-        if self.scroll_area and self.scroll_area.verticalScrollBar():
-            self.scroll_area.verticalScrollBar().setValue(0)
+        scroll_bar = self.scroll_area.verticalScrollBar() if self.scroll_area else None
+        # Skip when already at the top so valueChanged does not fire needlessly
+        if scroll_bar and scroll_bar.value() != 0:
+            scroll_bar.setValue(0)
             logger.debug("Scrolled faculty grid to top")
 
     def simulate_consultation_request(self):
@@ -958,8 +1707,16 @@ class DashboardWindow(BaseWindow):
 
     def _set_fallback_logo(self, size=QSize(64, 64), color=None):
         if color is None:
-            color = QColor(self.theme.PRIMARY_COLOR)
-        fallback_pixmap = QPixmap(size)
-        fallback_pixmap.fill(color)
-        # Potentially draw initials or a generic icon on the pixmap here
+            color = self._primary_qcolor
+        else:
+            color = QColor(color)
+
+        # Reuse the pixmap for this size/color instead of re-filling a new one each call
+        cache_key = (size.width(), size.height(), color.rgba())
+        fallback_pixmap = DashboardWindow._fallback_cache.get(cache_key)
+        if fallback_pixmap is None:
+            fallback_pixmap = QPixmap(size)
+            fallback_pixmap.fill(color)
+            # Potentially draw initials or a generic icon on the pixmap here
+            DashboardWindow._fallback_cache[cache_key] = fallback_pixmap
         self.logo_label.setPixmap(fallback_pixmap)
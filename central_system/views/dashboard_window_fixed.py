@@ -1,16 +1,90 @@
+import hashlib
 import logging
+import os
 from PyQt5.QtWidgets import QLabel
-from PyQt5.QtGui import QPixmap, QColor
-from PyQt5.QtCore import QSize
+from PyQt5.QtGui import QPixmap, QColor, QImage, QImageReader, QPixmapCache
+from PyQt5.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5 import sip
 
 from central_system.utils.icon_provider import IconProvider, Icons
 
 logger = logging.getLogger(__name__)
 
+# Pre-scaled thumbnails persist here across restarts, unlike QPixmapCache
+_THUMB_DIR = os.path.join(os.path.expanduser("~"), ".cache", "consultease", "thumbs")
+
+
+def _thumb_path(image_path):
+    """
+    Get the thumbnail cache file for a source image.
+
+    Args:
+        image_path (str): Absolute path of the source image
+
+    Returns:
+        str: Path of the PNG thumbnail under _THUMB_DIR
+    """
+    digest = hashlib.sha1(image_path.encode('utf-8')).hexdigest()
+    return os.path.join(_THUMB_DIR, f"{digest}.png")
+
+
+class ProfileImageSignals(QObject):
+    """
+    Signals emitted by ProfileImageLoader.
+    """
+    loaded = pyqtSignal(str, QImage)
+
+
+class ProfileImageLoader(QRunnable):
+    """
+    Load a faculty image at thumbnail size on a worker thread.
+    A thumbnail on disk is used while it is newer than the source image;
+    otherwise the source is decoded with QImageReader, which scales while
+    decoding so the full-size image is never held, and the thumbnail is rewritten.
+    """
+
+    def __init__(self, image_path, size):
+        super().__init__()
+        self.image_path = image_path
+        self.size = size
+        self.signals = ProfileImageSignals()
+
+    def run(self):
+        thumb_path = _thumb_path(self.image_path)
+        try:
+            thumb_fresh = os.path.getmtime(thumb_path) >= os.path.getmtime(self.image_path)
+        except OSError:
+            thumb_fresh = False
+
+        image = QImage()
+        if thumb_fresh:
+            image.load(thumb_path)
+
+        if image.isNull():
+            reader = QImageReader(self.image_path)
+            reader.setScaledSize(reader.size().scaled(self.size, Qt.KeepAspectRatio))
+            image = reader.read()
+            if not image.isNull():
+                try:
+                    os.makedirs(_THUMB_DIR, exist_ok=True)
+                    if not image.save(thumb_path, "PNG"):
+                        logger.warning(f"Could not write faculty thumbnail {thumb_path}")
+                except OSError as e:
+                    logger.warning(f"Could not create thumbnail directory {_THUMB_DIR}: {str(e)}")
+
+        self.signals.loaded.emit(self.image_path, image)
+
 
 class FacultyProfileWidget:
     """Widget to display faculty profile information with image and status."""
 
+    # One instance per faculty member, so skip the per-instance __dict__.
+    # __weakref__ is kept because signal connections to bound methods hold weak references.
+    __slots__ = ("faculty", "theme", "image_label", "_image_path", "__weakref__")
+
+    # Default avatar shared by all widgets without an image; QPixmap is implicitly shared
+    _DEFAULT_PIXMAP = None
+
     def __init__(self, faculty, theme):
         """
         Initialize the widget with faculty data.
@@ -23,56 +97,73 @@ class FacultyProfileWidget:
         self.theme = theme
         self.image_label = QLabel()
         self.image_label.setFixedSize(60, 60)
+        self._image_path = None
         self._load_faculty_image()
 
     def _load_faculty_image(self):
-        pixmap_loaded = False
         # Assume self.faculty.get_image_path() returns an absolute, verified
         # path or None
         image_path = self.faculty.get_image_path() if hasattr(
             self.faculty, 'get_image_path') else None
+        self._image_path = image_path
 
         if image_path:  # If model provides a valid path
-            try:
-                pixmap = QPixmap(image_path)
-                if not pixmap.isNull():
-                    self.image_label.setPixmap(pixmap)
-                    pixmap_loaded = True
-                else:
-                    logger.warning(
-                        f"Could not load image for faculty {self.faculty.name} "
-                        f"from provided path: {image_path} (pixmap isNull)"
-                    )
-            except Exception as e:
-                logger.error(
-                    f"Error loading faculty image for {self.faculty.name} "
-                    f"from {image_path}: {str(e)}"
-                )
-
-        if not pixmap_loaded:
-            # Fallback to default icon
-            try:
-                # Assuming IconProvider.get_icon returns a QIcon object
-                default_qicon = IconProvider.get_icon(Icons.USER)
-                if default_qicon and not default_qicon.isNull():
-                    # Specify size for pixmap
-                    self.image_label.setPixmap(default_qicon.pixmap(QSize(60, 60)))
-                else:
-                    logger.warning(
-                        f"Default user icon (Icons.USER) could not be loaded or is null. "
-                        f"Using theme placeholder for {self.faculty.name}."
-                    )
-                    fallback_pixmap = QPixmap(QSize(60, 60))
-                    fallback_pixmap.fill(QColor(self.theme.BG_SECONDARY))
-                    self.image_label.setPixmap(fallback_pixmap)
-            except Exception as e:
-                logger.error(
-                    f"Exception while trying to load default user icon for "
-                    f"{self.faculty.name}: {str(e)}"
-                )
-                fallback_pixmap = QPixmap(QSize(60, 60))
-                fallback_pixmap.fill(QColor(self.theme.BG_SECONDARY))
-                self.image_label.setPixmap(fallback_pixmap)
+            cached_pixmap = QPixmapCache.find(image_path)
+            if cached_pixmap is not None and not cached_pixmap.isNull():
+                self.image_label.setPixmap(cached_pixmap)
+                return
+
+        # Show the default avatar right away; the real image is decoded on a worker thread
+        self._set_default_image()
+
+        if image_path:
+            loader = ProfileImageLoader(image_path, self.image_label.size())
+            loader.signals.loaded.connect(self._on_faculty_image_loaded)
+            QThreadPool.globalInstance().start(loader)
+
+    def _on_faculty_image_loaded(self, image_path, image):
+        """
+        Apply a decoded faculty image. Runs on the UI thread.
+        """
+        # The label may have been deleted, or the faculty image changed, while decoding
+        if sip.isdeleted(self.image_label) or image_path != self._image_path:
+            return
+
+        if image.isNull():
+            logger.warning(
+                f"Could not load image for faculty {self.faculty.name} "
+                f"from provided path: {image_path} (image isNull)"
+            )
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(image_path, pixmap)
+        self.image_label.setPixmap(pixmap)
+
+    def _set_default_image(self):
+        cls = type(self)
+        if cls._DEFAULT_PIXMAP is None:
+            cls._DEFAULT_PIXMAP = self._build_default_pixmap()
+        self.image_label.setPixmap(cls._DEFAULT_PIXMAP)
+
+    def _build_default_pixmap(self):
+        # Fallback to default icon
+        try:
+            # Assuming IconProvider.get_icon returns a QIcon object
+            default_qicon = IconProvider.get_icon(Icons.USER)
+            if default_qicon and not default_qicon.isNull():
+                # Specify size for pixmap
+                return default_qicon.pixmap(QSize(60, 60))
+            logger.warning(
+                "Default user icon (Icons.USER) could not be loaded or is null. "
+                "Using theme placeholder."
+            )
+        except Exception as e:
+            logger.error(f"Exception while trying to load default user icon: {str(e)}")
+
+        fallback_pixmap = QPixmap(QSize(60, 60))
+        fallback_pixmap.fill(QColor(self.theme.BG_SECONDARY))
+        return fallback_pixmap
 
     def get_image_label(self):
         """
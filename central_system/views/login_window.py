@@ -1,8 +1,9 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                             QPushButton, QFrame, QMessageBox, QLineEdit)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+                             QPushButton, QFrame, QLineEdit)
+from PyQt5.QtCore import Qt, QEvent, pyqtSignal, pyqtSlot, QTimer
 from PyQt5.QtGui import QPixmap, QIcon
 import os
+import re
 import logging
 
 from .base_window import BaseWindow
@@ -11,6 +12,105 @@ from ..controllers import RFIDController, StudentController  # Import the contro
 from ..config import get_config  # Added import for get_config
 from ..services import get_rfid_service  # Added import
 from ..utils.keyboard_manager import get_keyboard_manager  # Added import
+from ..utils.ui_components import NotificationBanner
+
+logger = logging.getLogger(__name__)
+
+# Same rule as Student.validate_rfid_uid (4-32 ASCII letters and digits); rejects
+# anything else before a DB lookup
+_RFID_UID_RE = re.compile(r'[A-Za-z0-9]{4,32}')
+
+# Stylesheets are built once at import; the theme values are class constants
+_HEADER_QSS = f"background-color: {ConsultEaseTheme.PRIMARY_COLOR}; color: {ConsultEaseTheme.TEXT_LIGHT};"
+_TITLE_QSS = (f"font-size: {ConsultEaseTheme.FONT_SIZE_XXLARGE}pt; font-weight: bold; "
+              f"color: {ConsultEaseTheme.TEXT_LIGHT};")
+_INSTRUCTION_QSS = f"font-size: {ConsultEaseTheme.FONT_SIZE_LARGE}pt; color: {ConsultEaseTheme.TEXT_LIGHT};"
+_CONTENT_QSS = f"background-color: {ConsultEaseTheme.BG_SECONDARY};"
+_FOOTER_QSS = f"background-color: {ConsultEaseTheme.PRIMARY_COLOR};"
+_STATUS_READY_QSS = f"font-size: {ConsultEaseTheme.FONT_SIZE_XLARGE}pt; color: {ConsultEaseTheme.SECONDARY_COLOR};"
+_STATUS_ERROR_QSS = f"font-size: {ConsultEaseTheme.FONT_SIZE_LARGE}pt; color: {ConsultEaseTheme.ERROR_COLOR};"
+_ICON_ACTIVE_QSS = f"font-size: 48pt; color: {ConsultEaseTheme.SECONDARY_COLOR};"
+_ICON_IDLE_QSS = "font-size: 48pt; color: #ccc;"
+
+# The scanning frame switches between these rules through its "state" property
+_SCANNING_FRAME_QSS = f'''
+    QFrame#scanningFrame {{
+        background-color: {ConsultEaseTheme.BG_SECONDARY};
+        border-radius: {ConsultEaseTheme.BORDER_RADIUS_LARGE}px;
+        border: 2px solid {ConsultEaseTheme.BORDER_COLOR};
+    }}
+    QFrame#scanningFrame[state="ok"] {{
+        background-color: #e8f5e9;
+        border: 2px solid #4caf50;
+    }}
+    QFrame#scanningFrame[state="err"] {{
+        background-color: #fdecea;
+        border: 2px solid {ConsultEaseTheme.ERROR_COLOR};
+    }}
+'''
+_STATUS_SUCCESS_QSS = "font-size: 20pt; color: #4caf50;"
+
+_RFID_INPUT_QSS = f"""
+    QLineEdit {{
+        border: 1px solid {ConsultEaseTheme.BORDER_COLOR};
+        border-radius: {ConsultEaseTheme.BORDER_RADIUS_NORMAL}px;
+        padding: {ConsultEaseTheme.PADDING_NORMAL}px;
+        font-size: {ConsultEaseTheme.FONT_SIZE_NORMAL}pt;
+        background-color: {ConsultEaseTheme.BG_PRIMARY};
+        min-height: {ConsultEaseTheme.TOUCH_MIN_HEIGHT}px;
+    }}
+    QLineEdit:focus {{
+        border: 1px solid {ConsultEaseTheme.PRIMARY_COLOR};
+    }}
+"""
+
+_SUBMIT_BTN_QSS = f"""
+    QPushButton {{
+        background-color: {ConsultEaseTheme.PRIMARY_COLOR};
+        color: {ConsultEaseTheme.TEXT_LIGHT};
+        border: none;
+        padding: {ConsultEaseTheme.PADDING_NORMAL}px {ConsultEaseTheme.PADDING_LARGE}px;
+        border-radius: {ConsultEaseTheme.BORDER_RADIUS_NORMAL}px;
+        font-weight: bold;
+        min-height: {ConsultEaseTheme.TOUCH_MIN_HEIGHT}px;
+    }}
+    QPushButton:hover {{
+        background-color: {ConsultEaseTheme.PRIMARY_COLOR_HOVER};
+    }}
+"""
+
+_SIMULATE_BTN_QSS = f"""
+    QPushButton {{
+        background-color: {ConsultEaseTheme.SECONDARY_COLOR};
+        color: {ConsultEaseTheme.TEXT_PRIMARY};
+        border: none;
+        padding: {ConsultEaseTheme.PADDING_NORMAL}px {ConsultEaseTheme.PADDING_LARGE}px;
+        border-radius: {ConsultEaseTheme.BORDER_RADIUS_NORMAL}px;
+        font-weight: bold;
+        margin-top: 15px;
+        min-height: {ConsultEaseTheme.TOUCH_MIN_HEIGHT}px;
+    }}
+    QPushButton:hover {{
+        background-color: {ConsultEaseTheme.PRIMARY_COLOR};
+        color: {ConsultEaseTheme.TEXT_LIGHT};
+    }}
+"""
+
+_ADMIN_BTN_QSS = f'''
+    QPushButton {{
+        background-color: {ConsultEaseTheme.BG_DARK};
+        color: {ConsultEaseTheme.TEXT_LIGHT};
+        border: none;
+        border-radius: {ConsultEaseTheme.BORDER_RADIUS_NORMAL}px;
+        padding: {ConsultEaseTheme.PADDING_NORMAL}px {ConsultEaseTheme.PADDING_LARGE}px;
+        max-width: 200px;
+        min-height: {ConsultEaseTheme.TOUCH_MIN_HEIGHT}px;
+    }}
+    QPushButton:hover {{
+        background-color: {ConsultEaseTheme.PRIMARY_COLOR};
+        color: {ConsultEaseTheme.TEXT_LIGHT};
+    }}
+'''
 
 
 class LoginWindow(BaseWindow):
@@ -20,17 +120,22 @@ class LoginWindow(BaseWindow):
     # Signal to notify when a student is authenticated
     student_authenticated = pyqtSignal(object)
 
+    # Glyphs cycled by the scanning animation
+    _ANIMATION_FRAMES = ("🔄", "🔁", "🔃", "🔂")
+    _IDLE_GLYPH = "➖"
+
     def __init__(self, parent=None):
         self.config = get_config()
+        # The icon style is only reapplied on an idle/active change
+        self._icon_active = True
+        self._notification_banner = None  # Created on first show_success
         super().__init__(parent)
         self.rfid_controller = RFIDController.instance()  # Use singleton
         self.student_controller = StudentController.instance()  # Assuming it's needed
         self.rfid_service = get_rfid_service()
         self.keyboard_manager = get_keyboard_manager()
 
-        # Set up logging
-        self.logger = logging.getLogger(__name__)
-        self.logger.info("Initializing LoginWindow")
+        logger.info("Initializing LoginWindow")
 
         # Initialize state variables
         # self.rfid_reading = False # No longer managed here
@@ -39,6 +144,10 @@ class LoginWindow(BaseWindow):
         self.scanning_animation_frame = 0
         self.scan_active = False  # To control animation and status updates
 
+        # Registered once for the window's lifetime; reads are ignored while it is hidden
+        self._accept_rfid = False
+        self.rfid_controller.register_callback(self.handle_rfid_read)
+
     def init_ui(self):
         """
         Initialize the login UI components.
@@ -56,22 +165,19 @@ class LoginWindow(BaseWindow):
 
         # Dark header background
         header_frame = QFrame()
-        header_frame.setStyleSheet(
-            f"background-color: {ConsultEaseTheme.PRIMARY_COLOR}; color: {ConsultEaseTheme.TEXT_LIGHT};")
+        header_frame.setStyleSheet(_HEADER_QSS)
         header_layout = QVBoxLayout(header_frame)
         header_layout.setContentsMargins(20, 20, 20, 20)
 
         # Title
         title_label = QLabel("ConsultEase")
-        title_label.setStyleSheet(
-            f"font-size: {ConsultEaseTheme.FONT_SIZE_XXLARGE}pt; font-weight: bold; color: {ConsultEaseTheme.TEXT_LIGHT};")
+        title_label.setStyleSheet(_TITLE_QSS)
         title_label.setAlignment(Qt.AlignCenter)
         header_layout.addWidget(title_label)
 
         # Instruction label
         instruction_label = QLabel("Please scan your RFID card to authenticate")
-        instruction_label.setStyleSheet(
-            f"font-size: {ConsultEaseTheme.FONT_SIZE_LARGE}pt; color: {ConsultEaseTheme.TEXT_LIGHT};")
+        instruction_label.setStyleSheet(_INSTRUCTION_QSS)
         instruction_label.setAlignment(Qt.AlignCenter)
         header_layout.addWidget(instruction_label)
 
@@ -80,34 +186,28 @@ class LoginWindow(BaseWindow):
 
         # Content area - white background
         content_frame = QFrame()
-        content_frame.setStyleSheet(f"background-color: {ConsultEaseTheme.BG_SECONDARY};")
+        content_frame.setStyleSheet(_CONTENT_QSS)
         content_frame_layout = QVBoxLayout(content_frame)
         content_frame_layout.setContentsMargins(50, 50, 50, 50)
 
         # RFID scanning indicator
         self.scanning_frame = QFrame()
-        self.scanning_frame.setStyleSheet(f'''
-            QFrame {{
-                background-color: {ConsultEaseTheme.BG_SECONDARY};
-                border-radius: {ConsultEaseTheme.BORDER_RADIUS_LARGE}px;
-                border: 2px solid {ConsultEaseTheme.BORDER_COLOR};
-            }}
-        ''')
+        self.scanning_frame.setObjectName("scanningFrame")
+        self.scanning_frame.setProperty("state", "idle")
+        self.scanning_frame.setStyleSheet(_SCANNING_FRAME_QSS)
         scanning_layout = QVBoxLayout(self.scanning_frame)
         scanning_layout.setContentsMargins(30, 30, 30, 30)
         scanning_layout.setSpacing(20)
 
         self.scanning_status_label = QLabel("Ready to Scan")
-        self.scanning_status_label.setStyleSheet(
-            f"font-size: {ConsultEaseTheme.FONT_SIZE_XLARGE}pt; color: {ConsultEaseTheme.SECONDARY_COLOR};")
+        self.scanning_status_label.setStyleSheet(_STATUS_READY_QSS)
         self.scanning_status_label.setAlignment(Qt.AlignCenter)
         scanning_layout.addWidget(self.scanning_status_label)
 
         self.rfid_icon_label = QLabel()
         # Ideally, we would have an RFID icon image here
-        self.rfid_icon_label.setText("🔄")
-        self.rfid_icon_label.setStyleSheet(
-            f"font-size: 48pt; color: {ConsultEaseTheme.SECONDARY_COLOR};")
+        self.rfid_icon_label.setText(self._ANIMATION_FRAMES[0])
+        self.rfid_icon_label.setStyleSheet(_ICON_ACTIVE_QSS)
         self.rfid_icon_label.setAlignment(Qt.AlignCenter)
         scanning_layout.addWidget(self.rfid_icon_label)
 
@@ -116,37 +216,12 @@ class LoginWindow(BaseWindow):
 
         self.rfid_input = QLineEdit()
         self.rfid_input.setPlaceholderText("Enter RFID manually")
-        self.rfid_input.setStyleSheet(f"""
-            QLineEdit {{
-                border: 1px solid {ConsultEaseTheme.BORDER_COLOR};
-                border-radius: {ConsultEaseTheme.BORDER_RADIUS_NORMAL}px;
-                padding: {ConsultEaseTheme.PADDING_NORMAL}px;
-                font-size: {ConsultEaseTheme.FONT_SIZE_NORMAL}pt;
-                background-color: {ConsultEaseTheme.BG_PRIMARY};
-                min-height: {ConsultEaseTheme.TOUCH_MIN_HEIGHT}px;
-            }}
-            QLineEdit:focus {{
-                border: 1px solid {ConsultEaseTheme.PRIMARY_COLOR};
-            }}
-        """)
+        self.rfid_input.setStyleSheet(_RFID_INPUT_QSS)
         self.rfid_input.returnPressed.connect(self.handle_manual_rfid_entry)
         manual_input_layout.addWidget(self.rfid_input, 3)
 
         submit_button = QPushButton("Submit")
-        submit_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {ConsultEaseTheme.PRIMARY_COLOR};
-                color: {ConsultEaseTheme.TEXT_LIGHT};
-                border: none;
-                padding: {ConsultEaseTheme.PADDING_NORMAL}px {ConsultEaseTheme.PADDING_LARGE}px;
-                border-radius: {ConsultEaseTheme.BORDER_RADIUS_NORMAL}px;
-                font-weight: bold;
-                min-height: {ConsultEaseTheme.TOUCH_MIN_HEIGHT}px;
-            }}
-            QPushButton:hover {{
-                background-color: {ConsultEaseTheme.PRIMARY_COLOR_HOVER};
-            }}
-        """)
+        submit_button.setStyleSheet(_SUBMIT_BTN_QSS)
         submit_button.clicked.connect(self.handle_manual_rfid_entry)
         manual_input_layout.addWidget(submit_button, 1)
 
@@ -154,22 +229,7 @@ class LoginWindow(BaseWindow):
 
         # Add the simulate button inside the scanning frame
         self.simulate_button = QPushButton("Simulate RFID Scan")
-        self.simulate_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {ConsultEaseTheme.SECONDARY_COLOR};
-                color: {ConsultEaseTheme.TEXT_PRIMARY};
-                border: none;
-                padding: {ConsultEaseTheme.PADDING_NORMAL}px {ConsultEaseTheme.PADDING_LARGE}px;
-                border-radius: {ConsultEaseTheme.BORDER_RADIUS_NORMAL}px;
-                font-weight: bold;
-                margin-top: 15px;
-                min-height: {ConsultEaseTheme.TOUCH_MIN_HEIGHT}px;
-            }}
-            QPushButton:hover {{
-                background-color: {ConsultEaseTheme.PRIMARY_COLOR};
-                color: {ConsultEaseTheme.TEXT_LIGHT};
-            }}
-        """)
+        self.simulate_button.setStyleSheet(_SIMULATE_BTN_QSS)
         self.simulate_button.clicked.connect(self.simulate_rfid_scan)
         scanning_layout.addWidget(self.simulate_button)
 
@@ -180,27 +240,13 @@ class LoginWindow(BaseWindow):
 
         # Footer with admin login button
         footer_frame = QFrame()
-        footer_frame.setStyleSheet(f"background-color: {ConsultEaseTheme.PRIMARY_COLOR};")
+        footer_frame.setStyleSheet(_FOOTER_QSS)
         footer_frame.setFixedHeight(70)
         footer_layout = QHBoxLayout(footer_frame)
 
         # Admin login button
         admin_button = QPushButton("Admin Login")
-        admin_button.setStyleSheet(f'''
-            QPushButton {{
-                background-color: {ConsultEaseTheme.BG_DARK};
-                color: {ConsultEaseTheme.TEXT_LIGHT};
-                border: none;
-                border-radius: {ConsultEaseTheme.BORDER_RADIUS_NORMAL}px;
-                padding: {ConsultEaseTheme.PADDING_NORMAL}px {ConsultEaseTheme.PADDING_LARGE}px;
-                max-width: 200px;
-                min-height: {ConsultEaseTheme.TOUCH_MIN_HEIGHT}px;
-            }}
-            QPushButton:hover {{
-                background-color: {ConsultEaseTheme.PRIMARY_COLOR};
-                color: {ConsultEaseTheme.TEXT_LIGHT};
-            }}
-        ''')
+        admin_button.setStyleSheet(_ADMIN_BTN_QSS)
         admin_button.clicked.connect(self.admin_login)
 
         footer_layout.addStretch()
@@ -217,12 +263,12 @@ class LoginWindow(BaseWindow):
     def showEvent(self, event):
         """
         Called when the window is shown.
-        Focus RFID input and register for RFID scans.
+        Focus RFID input and start accepting RFID scans.
         """
         super().showEvent(event)  # Call base class method
         self.rfid_input.setFocus()
-        self.logger.info("LoginWindow shown, registering RFID callback.")
-        self.rfid_controller.register_callback(self.handle_rfid_read)
+        logger.info("LoginWindow shown, accepting RFID scans.")
+        self._accept_rfid = True
         self.reset_scan_ui()  # Reset UI to initial scanning state
         self.scanning_timer.start(500)  # Start animation
         self.scan_active = True
@@ -232,66 +278,103 @@ class LoginWindow(BaseWindow):
     def hideEvent(self, event):
         """
         Called when the window is hidden.
-        Unregister RFID callback.
+        Stop accepting RFID scans.
         """
-        self.logger.info("LoginWindow hidden, unregistering RFID callback.")
-        self.rfid_controller.unregister_callback(self.handle_rfid_read)
+        logger.info("LoginWindow hidden, ignoring RFID scans.")
+        self._accept_rfid = False
         self.scanning_timer.stop()  # Stop animation
         self.scan_active = False
         super().hideEvent(event)  # Call base class method
 
+    def changeEvent(self, event):
+        """
+        Pause the scanning animation while the window is minimized or inactive.
+        """
+        if event.type() in (QEvent.WindowStateChange, QEvent.ActivationChange):
+            if self.isMinimized() or not self.isActiveWindow():
+                self.scanning_timer.stop()
+            elif self.scan_active and self.isVisible() and not self.scanning_timer.isActive():
+                self.scanning_timer.start(500)
+        super().changeEvent(event)
+
     def resizeEvent(self, event):
         """
         Adjust UI elements on window resize.
         """
         super().resizeEvent(event)  # Call base class method for global handling
 
+    @pyqtSlot()
     def reset_scan_ui(self):
         """Resets the scanning UI to its initial state."""
         self.scanning_status_label.setText("Ready to Scan")
-        self.scanning_status_label.setStyleSheet(
-            f"font-size: {ConsultEaseTheme.FONT_SIZE_XLARGE}pt; color: {ConsultEaseTheme.SECONDARY_COLOR};")
-        self.rfid_icon_label.setText("🔄")
-        self.rfid_icon_label.setStyleSheet(
-            f"font-size: 48pt; color: {ConsultEaseTheme.SECONDARY_COLOR};")
+        self.scanning_status_label.setStyleSheet(_STATUS_READY_QSS)
+        self._set_scan_state("idle")
+        self.rfid_icon_label.setText(self._ANIMATION_FRAMES[0])
+        self._set_icon_active(True)
         self.rfid_input.clear()
         self.rfid_input.setFocus()
         self.scan_active = True
-        if not self.scanning_timer.isActive():
+        # A reset scheduled before the window was hidden must not restart the timer
+        if self.isVisible() and not self.scanning_timer.isActive():
             self.scanning_timer.start(500)
 
+    @pyqtSlot()
     def update_scanning_animation(self):
         """
         Update the scanning animation frame.
         """
         if not self.scan_active:  # Only animate if scanning is supposed to be active
-            self.rfid_icon_label.setText("➖")  # Idle state
-            self.rfid_icon_label.setStyleSheet(f"font-size: 48pt; color: #ccc;")
+            self.rfid_icon_label.setText(self._IDLE_GLYPH)  # Idle state
+            self._set_icon_active(False)
+            return
+
+        frames = self._ANIMATION_FRAMES
+        self.scanning_animation_frame = (self.scanning_animation_frame + 1) % len(frames)
+        self.rfid_icon_label.setText(frames[self.scanning_animation_frame])
+        self._set_icon_active(True)
+
+    def _set_scan_state(self, state):
+        """
+        Switch the scanning frame between its idle, ok and err styles.
+        """
+        frame = self.scanning_frame
+        if frame.property("state") == state:
             return
+        frame.setProperty("state", state)
+        frame.style().unpolish(frame)
+        frame.style().polish(frame)
 
-        animation_frames = ["🔄", "🔁", "🔃", "🔂"]
-        self.scanning_animation_frame = (self.scanning_animation_frame + 1) % len(animation_frames)
-        self.rfid_icon_label.setText(animation_frames[self.scanning_animation_frame])
-        self.rfid_icon_label.setStyleSheet(
-            f"font-size: 48pt; color: {ConsultEaseTheme.SECONDARY_COLOR};")
+    def _set_icon_active(self, active):
+        """
+        Apply the active or idle icon style, skipping the restyle if it is unchanged.
+        """
+        if active == self._icon_active:
+            return
+        self._icon_active = active
+        self.rfid_icon_label.setStyleSheet(_ICON_ACTIVE_QSS if active else _ICON_IDLE_QSS)
 
+    # error_message is None on success, so it can't be declared as str
+    @pyqtSlot(object, str, object)
     def handle_rfid_read(self, student, rfid_uid, error_message=None):
         """
         Handle RFID read events from the RFIDController.
         The 'student' object is now directly provided by RFIDController.
         """
+        if not self._accept_rfid:
+            return
+
         self.scanning_timer.stop()  # Stop animation
         self.scan_active = False
 
         if error_message:
-            self.logger.error(f"RFID Error: {error_message} for UID: {rfid_uid}")
+            logger.error("RFID Error: %s for UID: %s", error_message, rfid_uid)
             self.show_error(error_message)
             # Optionally, restart scanning after a delay
             QTimer.singleShot(3000, self.reset_scan_ui)
             return
 
         if student:
-            self.logger.info(f"Student {student.name} authenticated via RFID UID: {rfid_uid}")
+            logger.info("Student %s authenticated via RFID UID: %s", student.name, rfid_uid)
             self.student_authenticated.emit(student)
             self.show_success(f"Welcome, {student.name}!")
             # No need for further DB lookup here, student object is already validated
@@ -299,8 +382,8 @@ class LoginWindow(BaseWindow):
         else:
             # This case should ideally be handled by RFIDController returning an error_message
             # if the UID is unknown or invalid, but we'll keep a fallback.
-            self.logger.warning(
-                f"Unknown RFID UID scanned: {rfid_uid}. Student not found by RFIDController.")
+            logger.warning(
+                "Unknown RFID UID scanned: %s. Student not found by RFIDController.", rfid_uid)
             self.show_error("RFID card not recognized. Please register your card or try again.")
             # Optionally, restart scanning after a delay
             QTimer.singleShot(3000, self.reset_scan_ui)
@@ -310,36 +393,35 @@ class LoginWindow(BaseWindow):
         Show success message and visual feedback.
         """
         self.scanning_status_label.setText("Authenticated")
-        self.scanning_status_label.setStyleSheet("font-size: 20pt; color: #4caf50;")
-        self.scanning_frame.setStyleSheet('''
-            QFrame {
-                background-color: #e8f5e9;
-                border-radius: 10px;
-                border: 2px solid #4caf50;
-            }
-        ''')
+        self.scanning_status_label.setStyleSheet(_STATUS_SUCCESS_QSS)
+        self._set_scan_state("ok")
         self.rfid_icon_label.setText("✅")
 
-        # Show message in a popup
-        QMessageBox.information(self, "Authentication Success", message)
+        # Show the message in a self-dismissing banner so RFID handling is never blocked by a modal
+        if self._notification_banner is None:
+            self._notification_banner = NotificationBanner(self.centralWidget())
+        self._notification_banner.raise_()
+        self._notification_banner.show_message(message, NotificationBanner.SUCCESS, 1500)
 
     def show_error(self, message):
         """
         Show an error message in the UI.
         """
-        self.logger.error(f"Login UI Error: {message}")
+        logger.error("Login UI Error: %s", message)
         self.scanning_status_label.setText(message)
-        self.scanning_status_label.setStyleSheet(
-            f"font-size: {ConsultEaseTheme.FONT_SIZE_LARGE}pt; color: {ConsultEaseTheme.ERROR_COLOR};")
+        self.scanning_status_label.setStyleSheet(_STATUS_ERROR_QSS)
+        self._set_scan_state("err")
         # self.rfid_icon_label.setText("❌") # Icon set by handle_rfid_read
         # self.rfid_icon_label.setStyleSheet(f"font-size: 48pt; color: {ConsultEaseTheme.ERROR_COLOR};")
 
+    @pyqtSlot()
     def admin_login(self):
         """
         Handle admin login button click.
         """
         self.change_window.emit("admin_login", None)
 
+    @pyqtSlot()
     def simulate_rfid_scan(self):
         """
         Simulate an RFID scan for testing purposes.
@@ -347,34 +429,37 @@ class LoginWindow(BaseWindow):
         if not self.scan_active:
             self.reset_scan_ui()  # Ensure UI is ready for a new scan
 
-        self.logger.info("Simulating RFID scan...")
+        logger.info("Simulating RFID scan...")
         self.scanning_status_label.setText("Simulating Scan...")
         self.rfid_icon_label.setText("⏳")
-        self.rfid_icon_label.setStyleSheet(
-            f"font-size: 48pt; color: {ConsultEaseTheme.SECONDARY_COLOR};")
+        self._set_icon_active(True)
 
         # Call the controller's simulation method
         # The controller will then invoke the registered callback (handle_rfid_read)
         self.rfid_controller.simulate_scan()
 
+    @pyqtSlot()
     def handle_manual_rfid_entry(self):
         """
         Handle manual RFID UID entry.
         """
-        uid = self.rfid_input.text().strip().upper()
+        uid = self.rfid_input.text().strip()
         if not uid:
             self.show_error("Please enter an RFID UID.")
             # QTimer.singleShot(2000, self.reset_scan_ui) # Allow re-entry
             return
+        if not _RFID_UID_RE.fullmatch(uid):
+            self.show_error("RFID UID must be 4-32 letters or digits.")
+            return
+        uid = uid.upper()
 
         if not self.scan_active:
             self.reset_scan_ui()  # Ensure UI is ready for a new scan
 
-        self.logger.info(f"Manual RFID entry submitted: {uid}")
+        logger.info("Manual RFID entry submitted: %s", uid)
         self.scanning_status_label.setText(f"Processing UID: {uid}...")
         self.rfid_icon_label.setText("⏳")
-        self.rfid_icon_label.setStyleSheet(
-            f"font-size: 48pt; color: {ConsultEaseTheme.SECONDARY_COLOR};")
+        self._set_icon_active(True)
 
         # Clear the input field after submission
         self.rfid_input.clear()
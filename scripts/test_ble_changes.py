@@ -25,12 +25,37 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Import models and services
-from central_system.models import Faculty, init_db, get_db
+from sqlalchemy.orm import sessionmaker
+
+from central_system.models import Faculty, init_db
+from central_system.models.base import engine
 from central_system.services import get_mqtt_service
 # FacultyController might not be directly needed if we are only testing MQTT processing by the service
 # from central_system.controllers import FacultyController 
 from central_system.utils.mqtt_topics import MQTTTopics
 
+def wait_until(predicate, timeout=2.0, interval=0.05):
+    """
+    Poll predicate until it returns True or the timeout expires.
+
+    Returns:
+        bool: True if the predicate was satisfied before the timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if predicate():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+def pending_faculty(db, faculty_ids, expected):
+    """
+    Reload the faculty rows in one query and return those whose status does not match expected yet.
+    """
+    rows = db.query(Faculty).filter(Faculty.id.in_(faculty_ids)).populate_existing().all()
+    return [faculty for faculty in rows if bool(faculty.status) != expected]
+
 def test_faculty_status_update():
     """
     Test faculty status update based on BLE connection.
@@ -39,22 +64,19 @@ def test_faculty_status_update():
         # Initialize database
         init_db()
         
-        # Get database connection
-        db = get_db()
+        # Use a dedicated session that keeps loaded rows usable after commit;
+        # statuses are reloaded explicitly by pending_faculty()
+        db = sessionmaker(bind=engine, expire_on_commit=False)()
         
         # Get MQTT service
         mqtt_service = get_mqtt_service()
         
         # Connect to MQTT broker
         if not mqtt_service.is_connected:
-            # Ensure MQTTService is started if it has a connect method that needs to be called
-            # This depends on MQTTService implementation (singleton, explicit start, etc.)
-            # For now, assuming get_mqtt_service() returns a ready or connectable service.
-            if hasattr(mqtt_service, 'connect') and callable(getattr(mqtt_service, 'connect')):
-                mqtt_service.connect() 
-            # Add a small delay to ensure connection if connect() is async or needs time
-            time.sleep(1) # Adjust as necessary
-            if not mqtt_service.is_connected:
+            # connect_async() is a no-op if the connection worker is already running
+            mqtt_service.connect_async()
+            # The worker gives each connection attempt up to 3 seconds
+            if not wait_until(lambda: mqtt_service.is_connected, timeout=3.0):
                 logger.error("Failed to connect to MQTT broker after explicit connect call.")
                 return False
             logger.info("Connected to MQTT broker")
@@ -70,67 +92,55 @@ def test_faculty_status_update():
             # If init_db should create sample faculty, this is a problem.
             return True # Or False if faculty are expected
         
-        logger.info(f"Found {len(faculty_list)} faculty members. Testing status updates...")
+        logger.info("Found %d faculty members. Testing status updates...", len(faculty_list))
         
         success_overall = True
+        tested = []
+        tested_ids = []
+        original_statuses = {}
         for faculty in faculty_list:
-            logger.info(f"Testing faculty: {faculty.name} (ID: {faculty.id})")
-            
             if faculty.always_available:
-                logger.error(f"Faculty {faculty.name} has always_available=True. This field is deprecated and should be False.")
-                success_overall = False
-                continue # Skip to next faculty if this one has problematic config
-            
-            original_status = faculty.status
-            logger.info(f"  - Original status: {original_status}")
-            
-            status_update_topic = MQTTTopics.get_faculty_status_topic(faculty.id)
-            
-            # Test BLE connection (simulate keychain_connected)
-            logger.info(f"  - Simulating BLE connection (keychain_connected) for faculty {faculty.name} on topic {status_update_topic}")
-            # The payload for status updates is typically a JSON string like {"status": true/false, ...}
-            # However, the original script used raw "keychain_connected". Let's check mqtt_service publish_raw or FacultyController handler.
-            # For now, sticking to raw string if that was the previous contract for this test.
-            # The FacultyController.handle_faculty_status_update expects specific payload formats.
-            # If ESP32 sends simple strings, FacultyController needs to parse them.
-            # Let's assume for this test the simplified string is what the FacultyController expects for status.
-            # A better payload might be json.dumps({"status": True, "device_name": "test_beacon"})
-            mqtt_service.publish_raw(status_update_topic, "keychain_connected") # Using publish_raw as in original test
-            
-            logger.info("  - Waiting for status update (2s)...")
-            time.sleep(2)
-            
-            db.refresh(faculty) # Refresh from DB
-            if not faculty.status:
-                logger.error(f"Faculty {faculty.name} status NOT updated to True after 'keychain_connected'. Status: {faculty.status}")
+                logger.error("Faculty %s has always_available=True. This field is deprecated and should be False.", faculty.name)
                 success_overall = False
-            else:
-                logger.info(f"  - Status after BLE connection: {faculty.status} (Expected True)")
-            
-            # Test BLE disconnection (simulate keychain_disconnected)
-            logger.info(f"  - Simulating BLE disconnection (keychain_disconnected) for faculty {faculty.name} on topic {status_update_topic}")
-            mqtt_service.publish_raw(status_update_topic, "keychain_disconnected")
-            
-            logger.info("  - Waiting for status update (2s)...")
-            time.sleep(2)
+                continue # Skip this faculty since it has problematic config
+            original_statuses[faculty.id] = faculty.status
+            tested.append(faculty)
+            tested_ids.append(faculty.id)
+            logger.info("Testing faculty: %s (ID: %s), original status: %s", faculty.name, faculty.id, faculty.status)
+        
+        # The payload for status updates is typically a JSON string like {"status": true/false, ...}.
+        # The original test used the raw "keychain_connected"/"keychain_disconnected" strings,
+        # so this keeps that contract; a better payload might be
+        # json.dumps({"status": True, "device_name": "test_beacon"})
+        # Every message is published back to back and then awaited once, so the total wait
+        # does not grow with the number of faculty.
+        for payload, expected in (("keychain_connected", True), ("keychain_disconnected", False)):
+            logger.info("  - Publishing '%s' for %d faculty members", payload, len(tested))
+            for faculty in tested:
+                mqtt_service.publish_raw(MQTTTopics.get_faculty_status_topic(faculty.id), payload)
             
-            db.refresh(faculty)
-            if faculty.status:
-                logger.error(f"Faculty {faculty.name} status NOT updated to False after 'keychain_disconnected'. Status: {faculty.status}")
+            logger.info("  - Waiting for status updates (up to 5s)...")
+            wait_until(lambda: not pending_faculty(db, tested_ids, expected), timeout=5.0)
+            for faculty in pending_faculty(db, tested_ids, expected):
+                logger.error("Faculty %s status NOT updated to %s after '%s'. Status: %s", faculty.name, expected, payload, faculty.status)
                 success_overall = False
-            else:
-                logger.info(f"  - Status after BLE disconnection: {faculty.status} (Expected False)")
-            
-            # Restore original status for idempotency if other tests rely on initial state
+            logger.info("  - Status check after '%s' finished (Expected %s)", payload, expected)
+        
+        # Restore original statuses for idempotency if other tests rely on initial state
+        restored = False
+        for faculty in tested:
+            original_status = original_statuses[faculty.id]
             if faculty.status != original_status:
                 faculty.status = original_status
-                db.commit()
-                logger.info(f"  - Restored original status to: {original_status}")
+                restored = True
+        if restored:
+            db.commit()
+            logger.info("  - Restored original faculty statuses")
         
         db.close() # Close session
         return success_overall
     except Exception as e:
-        logger.error(f"Error testing faculty status update: {e}", exc_info=True)
+        logger.error("Error testing faculty status update: %s", e, exc_info=True)
         # Ensure db session is closed on error too
         if 'db' in locals() and db.is_active:
             db.close()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+ConsultEase - Dashboard Rebuild Test Script
+
+The dashboard's init_ui() runs again whenever a new student logs in, which replaces
+(and deletes) the window's central widget. This script checks that the dashboard
+still works after such a rebuild and does not accumulate timers.
+
+Usage:
+    python test_dashboard_rebuild.py
+"""
+
+import sys
+import os
+import logging
+
+# Run without a display unless one was requested explicitly
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt, QTimer
+
+# Add parent directory to path so we can import from central_system
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Import ConsultEase components
+try:
+    from central_system.views.dashboard_window import DashboardWindow
+    logger.info("Successfully imported ConsultEase components")
+except ImportError as e:
+    logger.error(f"Failed to import ConsultEase components: {e}")
+    sys.exit(1)
+
+
+def test_banner_after_rebuild(window):
+    """Show the notification banner before and after init_ui() rebuilds the window twice."""
+    window._show_banner("Banner before rebuild", "info")
+    window.init_ui()
+    window.init_ui()
+    try:
+        window._show_banner("Consultation request submitted", "success")
+    except RuntimeError as e:
+        logger.error(f"Showing the banner after a rebuild failed: {e}")
+        return False
+    if window._notification_banner.parent() is not window.centralWidget():
+        logger.error("Notification banner is not attached to the current central widget")
+        return False
+    logger.info("Notification banner works after rebuilding the dashboard")
+    return True
+
+
+def test_timers_after_rebuild(window):
+    """Check that rebuilding the dashboard does not add timers to the window."""
+    timer_count = len(window.findChildren(QTimer, options=Qt.FindDirectChildrenOnly))
+    window.init_ui()
+    window.init_ui()
+    new_count = len(window.findChildren(QTimer, options=Qt.FindDirectChildrenOnly))
+    if new_count != timer_count:
+        logger.error(f"Window timers grew from {timer_count} to {new_count} after two rebuilds")
+        return False
+    logger.info("Rebuilding the dashboard does not leak timers")
+    return True
+
+
+def main():
+    """Main function."""
+    app = QApplication(sys.argv)
+    window = DashboardWindow(student=None)
+    try:
+        success = all([test_banner_after_rebuild(window),
+                       test_timers_after_rebuild(window)])
+        app.processEvents()
+    finally:
+        window.close()
+
+    if success:
+        logger.info("All tests completed successfully")
+        return 0
+    else:
+        logger.error("Tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
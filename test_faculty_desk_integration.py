@@ -6,13 +6,35 @@ This script tests the communication between the central system and faculty desk
 by simulating faculty presence status updates and consultation requests.
 """
 
+import os
 import sys
 import json
 import time
+import socket
+import threading
+import itertools
+import random
 import paho.mqtt.client as mqtt
 import logging
 import argparse
-from datetime import datetime
+from collections import deque
+
+# orjson is optional; it encodes straight to bytes and is much faster than the json module
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    _HAS_ORJSON = False
+
+if _HAS_ORJSON:
+    dumps_bytes = orjson.dumps
+    loads_bytes = orjson.loads
+else:
+    def dumps_bytes(obj):
+        return json.dumps(obj).encode()
+    # json.loads accepts UTF-8 bytes directly
+    loads_bytes = json.loads
 
 # Configure logging
 logging.basicConfig(
@@ -103,6 +125,66 @@ RESPONSE_BUSY = {
     "status": "Professor is currently busy and cannot cater to this request"
 }
 
+# Suffix for generated response message ids, unique within this process
+_message_ids = itertools.count(1)
+
+# Tag added to every payload this process publishes so its echoes can be dropped undecoded
+TEST_NONCE = f"{os.getpid()}_{random.getrandbits(32)}"
+_TEST_NONCE_BYTES = TEST_NONCE.encode()
+
+class PayloadTemplate:
+    """
+    A message serialized once. A fresh millisecond timestamp, and a new message id
+    for response messages, are spliced into the encoded bytes on each render
+    instead of re-serializing the dict.
+    """
+    _PLACEHOLDERS = {
+        "timestamp": "0" * 13,
+        "message_id": "__message_id__",
+    }
+
+    def __init__(self, message):
+        names = [name for name in self._PLACEHOLDERS if name in message]
+        fields = {name: self._PLACEHOLDERS[name] for name in names}
+        encoded = dumps_bytes(dict(message, test_nonce=TEST_NONCE, **fields))
+        # Split the encoded bytes around each placeholder, in the order they appear
+        spots = sorted(
+            (encoded.index(b'"%s"' % self._PLACEHOLDERS[name].encode()) + 1, name) for name in names)
+        self._parts = []
+        self._fields = []
+        pos = 0
+        for offset, name in spots:
+            self._parts.append(encoded[pos:offset])
+            self._fields.append(name)
+            pos = offset + len(self._PLACEHOLDERS[name])
+        self._parts.append(encoded[pos:])
+
+    def render(self):
+        values = {"timestamp": b"%013d" % (time.time_ns() // 1000000)}
+        if "message_id" in self._fields:
+            values["message_id"] = b"%d_%d" % (time.monotonic_ns(), next(_message_ids))
+        chunks = [self._parts[0]]
+        for name, part in zip(self._fields, self._parts[1:]):
+            chunks.append(values[name])
+            chunks.append(part)
+        return b"".join(chunks)
+
+# The templates never change, so each is serialized once here rather than on every publish
+STATUS_AVAILABLE_PAYLOAD = PayloadTemplate(STATUS_AVAILABLE)
+STATUS_GRACE_PERIOD_PAYLOAD = PayloadTemplate(STATUS_GRACE_PERIOD)
+STATUS_UNAVAILABLE_PAYLOAD = PayloadTemplate(STATUS_UNAVAILABLE)
+CONSULTATION_REQUEST_PAYLOAD = PayloadTemplate(CONSULTATION_REQUEST)
+RESPONSE_ACKNOWLEDGE_PAYLOAD = PayloadTemplate(RESPONSE_ACKNOWLEDGE)
+RESPONSE_BUSY_PAYLOAD = PayloadTemplate(RESPONSE_BUSY)
+
+def encode_payload(message):
+    """Return message as bytes, rendering templates and passing raw bytes through unchanged."""
+    if isinstance(message, bytes):
+        return message
+    if isinstance(message, PayloadTemplate):
+        return message.render()
+    return dumps_bytes(message)
+
 class FacultyDeskTester:
     def __init__(self, broker, port, username, password, faculty_id):
         self.broker = broker
@@ -110,44 +192,99 @@ class FacultyDeskTester:
         self.username = username
         self.password = password
         self.faculty_id = faculty_id
+        # Topics are fixed for the tester's lifetime, so build them once
+        self.status_topic = FACULTY_STATUS_TOPIC(faculty_id)
+        self.request_topic = FACULTY_REQUEST_TOPIC(faculty_id)
+        self.response_topic = FACULTY_RESPONSE_TOPIC(faculty_id)
+        self.heartbeat_topic = FACULTY_HEARTBEAT_TOPIC(faculty_id)
+        # Legacy topic that mirrors each current topic in the compatibility test
+        self.legacy_mirror = {
+            self.status_topic: LEGACY_STATUS_TOPIC,
+            self.request_topic: LEGACY_MESSAGES_TOPIC,
+        }
+        # Only responses are decoded and recorded; other traffic is just echoes of our publishes
+        self._record_topics = frozenset([self.response_topic, LEGACY_RESPONSES_TOPIC])
         self.client = None
-        self.connected = False
-        self.received_messages = []
+        self._connected_event = threading.Event()  # Set by on_connect once subscriptions are sent
+        # Only the most recent messages are kept so long runs don't grow without bound
+        self.received_messages = deque(maxlen=1000)
+        self.received_count = 0
+        # Scenarios publish from several threads, so each publish gets its own Event keyed by
+        # (topic, payload) that on_message sets when the message is echoed back
+        self._pending_echoes = {}
+        self._echo_lock = threading.Lock()
+        self._local = threading.local()  # Last expected echo of the calling thread
         
-    def on_connect(self, client, userdata, flags, rc):
-        if rc == 0:
-            self.connected = True
+    @property
+    def connected(self):
+        return self._connected_event.is_set()
+        
+    def on_connect(self, client, userdata, flags, reason_code, properties):
+        if not reason_code.is_failure:
             logger.info(f"Connected to MQTT broker at {self.broker}:{self.port}")
             
-            # Subscribe to response topics
-            client.subscribe(FACULTY_RESPONSE_TOPIC(self.faculty_id))
-            client.subscribe(LEGACY_RESPONSES_TOPIC)
+            # A resumed persistent session already holds the subscriptions
+            if flags.session_present:
+                logger.info("Resumed existing MQTT session, skipping subscriptions")
+            else:
+                # One SUBSCRIBE packet for all topics
+                client.subscribe([
+                    # Response topics
+                    (self.response_topic, 0),
+                    (LEGACY_RESPONSES_TOPIC, 0),
+                    # Request topics (to see our own messages for testing)
+                    (self.request_topic, 0),
+                    (LEGACY_MESSAGES_TOPIC, 0),
+                    # Status topics so status publishes are echoed back too
+                    (self.status_topic, 0),
+                    (LEGACY_STATUS_TOPIC, 0),
+                ])
             
-            # Subscribe to request topics (to see our own messages for testing)
-            client.subscribe(FACULTY_REQUEST_TOPIC(self.faculty_id))
-            client.subscribe(LEGACY_MESSAGES_TOPIC)
+            self._connected_event.set()
         else:
-            logger.error(f"Failed to connect to MQTT broker, return code: {rc}")
+            logger.error(f"Failed to connect to MQTT broker, reason code: {reason_code}")
             
     def on_message(self, client, userdata, msg):
+        event = self._take_echo_waiter((msg.topic, msg.payload))
+        if event is not None:
+            event.set()
+        # Our own publishes are echoed back; skip them before any decoding
+        if _TEST_NONCE_BYTES in msg.payload or msg.topic not in self._record_topics:
+            return
+            
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError; invalid UTF-8 raises UnicodeDecodeError
         try:
-            payload = msg.payload.decode()
-            data = json.loads(payload)
-            logger.info(f"Received message on topic {msg.topic}:")
-            logger.info(json.dumps(data, indent=2))
-            self.received_messages.append({
-                'topic': msg.topic,
-                'payload': data,
-                'timestamp': datetime.now().isoformat()
-            })
-        except Exception as e:
-            logger.error(f"Error processing message: {e}")
-            logger.error(f"Raw payload: {msg.payload}")
+            data = loads_bytes(msg.payload)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning("Bad JSON on %s: %s", msg.topic, e)
+            logger.error("Raw payload: %r", msg.payload)
+            return
+            
+        # The indented dump costs a full re-serialization, so only build it if it will be logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Received message on topic %s:\n%s", msg.topic, json.dumps(data, indent=2))
+        self.received_count += 1
+        self.received_messages.append({
+            'topic': msg.topic,
+            'payload': data,
+            'timestamp_ns': time.time_ns()  # Format with datetime.fromtimestamp() when reporting
+        })
+            
+    def on_socket_open(self, client, userdata, sock):
+        # Send each small publish immediately instead of letting Nagle hold it for coalescing
+        if isinstance(sock, socket.socket):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             
     def connect(self):
-        self.client = mqtt.Client()
+        # A test run should fail fast rather than keep reconnecting in the background
+        # A fixed client id with a persistent session lets the broker keep our subscriptions
+        self.client = mqtt.Client(callback_api_version=mqtt.CallbackAPIVersion.VERSION2,
+                                  client_id=f"faculty_desk_test_{self.faculty_id}",
+                                  clean_session=False,
+                                  reconnect_on_failure=False)
         self.client.on_connect = self.on_connect
         self.client.on_message = self.on_message
+        self.client.on_socket_open = self.on_socket_open
         
         if self.username and self.password:
             self.client.username_pw_set(self.username, self.password)
@@ -158,10 +295,8 @@ class FacultyDeskTester:
             self.client.loop_start()
             
             # Wait for connection
-            for _ in range(10):
-                if self.connected:
-                    return True
-                time.sleep(0.5)
+            if self._connected_event.wait(timeout=5.0):
+                return True
                 
             logger.error("Failed to connect to MQTT broker after timeout")
             return False
@@ -173,6 +308,7 @@ class FacultyDeskTester:
         if self.client:
             self.client.loop_stop()
             self.client.disconnect()
+            self._connected_event.clear()
             logger.info("Disconnected from MQTT broker")
             
     def publish_message(self, topic, message):
@@ -181,87 +317,159 @@ class FacultyDeskTester:
             return False
             
         try:
-            result = self.client.publish(topic, json.dumps(message))
-            if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                logger.info(f"Published message to {topic}")
-                return True
-            else:
+            payload = encode_payload(message)
+            self._expect_echo(topic, payload)
+            # QoS 0: fire-and-forget, the echo wait is the delivery check
+            result = self.client.publish(topic, payload, qos=0)
+            if result.rc != mqtt.MQTT_ERR_SUCCESS:
                 logger.error(f"Failed to publish message to {topic}, result code: {result.rc}")
                 return False
+            logger.debug("Published message to %s", topic)
+            return True
         except Exception as e:
             logger.error(f"Error publishing message: {e}")
             return False
             
-    def simulate_availability_sequence(self):
-        """Simulate a faculty becoming available, entering grace period, then becoming unavailable."""
-        # 1. Faculty becomes available
-        logger.info("\n=== TEST: Faculty Becomes Available ===")
-        self.publish_message(FACULTY_STATUS_TOPIC(self.faculty_id), STATUS_AVAILABLE)
-        time.sleep(2)
+    def publish_batch(self, items):
+        """Publish a list of (topic, message) pairs back to back on the open connection."""
+        if not self.connected:
+            logger.error("Not connected to MQTT broker")
+            return False
+            
+        try:
+            payloads = [(topic, encode_payload(message)) for topic, message in items]
+            # Messages on one connection arrive in order, so the last echo covers the whole batch
+            self._expect_echo(*payloads[-1])
+            results = [self.client.publish(topic, payload, qos=0) for topic, payload in payloads]
+            failed = [result.rc for result in results if result.rc != mqtt.MQTT_ERR_SUCCESS]
+            if failed:
+                logger.error(f"Failed to publish {len(failed)} of {len(items)} messages, result codes: {failed}")
+                return False
+            logger.debug("Published %d messages", len(items))
+            return True
+        except Exception as e:
+            logger.error(f"Error publishing messages: {e}")
+            return False
+            
+    def _expect_echo(self, topic, payload):
+        """Register an Event for the echo of the message the calling thread is about to publish."""
+        key = (topic, payload)
+        event = threading.Event()
+        with self._echo_lock:
+            self._pending_echoes.setdefault(key, []).append(event)
+        self._local.expected = (key, event)
         
-        # 2. Faculty enters grace period
-        logger.info("\n=== TEST: Faculty Enters Grace Period ===")
-        self.publish_message(FACULTY_STATUS_TOPIC(self.faculty_id), STATUS_GRACE_PERIOD)
-        time.sleep(2)
+    def _take_echo_waiter(self, key, event=None):
+        """Remove and return the oldest waiter for key, or the given one if it is still pending."""
+        with self._echo_lock:
+            waiters = self._pending_echoes.get(key)
+            if not waiters or (event is not None and event not in waiters):
+                return None
+            if event is None:
+                event = waiters[0]
+            waiters.remove(event)
+            if not waiters:
+                del self._pending_echoes[key]
+            return event
         
-        # 3. Faculty becomes unavailable
-        logger.info("\n=== TEST: Faculty Becomes Unavailable ===")
-        self.publish_message(FACULTY_STATUS_TOPIC(self.faculty_id), STATUS_UNAVAILABLE)
-        time.sleep(2)
+    def wait_for_echo(self, timeout=2.0):
+        """Wait until this thread's last published message is echoed back, or the timeout expires."""
+        expected = getattr(self._local, 'expected', None)
+        if expected is None:
+            return False
+        self._local.expected = None
+        key, event = expected
+        if event.wait(timeout):
+            return True
+        self._take_echo_waiter(key, event)
+        logger.warning(f"No echo received within {timeout}s for {key[0]}")
+        return False
+        
+    def simulate_availability_sequence(self):
+        """Simulate a faculty becoming available, entering grace period, then becoming unavailable."""
+        # Available -> grace period -> unavailable, sent as one batch; the broker keeps their order
+        logger.info("\n=== TEST: Faculty Becomes Available, Enters Grace Period, Becomes Unavailable ===")
+        published = self.publish_batch([
+            (self.status_topic, STATUS_AVAILABLE_PAYLOAD),
+            (self.status_topic, STATUS_GRACE_PERIOD_PAYLOAD),
+            (self.status_topic, STATUS_UNAVAILABLE_PAYLOAD),
+        ])
+        return published and self.wait_for_echo()
         
     def simulate_consultation_request(self):
         """Simulate a consultation request and response."""
         # 1. Faculty is available
         logger.info("\n=== TEST: Setting Faculty Available ===")
-        self.publish_message(FACULTY_STATUS_TOPIC(self.faculty_id), STATUS_AVAILABLE)
-        time.sleep(2)
+        if not (self.publish_message(self.status_topic, STATUS_AVAILABLE_PAYLOAD)
+                and self.wait_for_echo()):
+            return False
         
         # 2. Send consultation request
         logger.info("\n=== TEST: Sending Consultation Request ===")
-        self.publish_message(FACULTY_REQUEST_TOPIC(self.faculty_id), CONSULTATION_REQUEST)
-        time.sleep(2)
+        if not (self.publish_message(self.request_topic, CONSULTATION_REQUEST_PAYLOAD)
+                and self.wait_for_echo()):
+            return False
         
         # 3. Simulate faculty acknowledging request
         logger.info("\n=== TEST: Faculty Acknowledges Request ===")
-        self.publish_message(FACULTY_RESPONSE_TOPIC(self.faculty_id), RESPONSE_ACKNOWLEDGE)
-        time.sleep(2)
+        return (self.publish_message(self.response_topic, RESPONSE_ACKNOWLEDGE_PAYLOAD)
+                and self.wait_for_echo())
         
     def simulate_legacy_topics(self):
         """Test compatibility with legacy topics."""
-        # 1. Publish to legacy status topic
-        logger.info("\n=== TEST: Legacy Status Topic ===")
-        self.publish_message(LEGACY_STATUS_TOPIC, STATUS_AVAILABLE)
-        time.sleep(2)
+        # Publish each message to its current topic and the legacy mirror in one batch,
+        # using the same rendered bytes for both
+        logger.info("\n=== TEST: Legacy Status and Messages Topics ===")
+        items = []
+        for topic, template in ((self.status_topic, STATUS_AVAILABLE_PAYLOAD),
+                                (self.request_topic, CONSULTATION_REQUEST_PAYLOAD)):
+            payload = encode_payload(template)
+            items.append((topic, payload))
+            items.append((self.legacy_mirror[topic], payload))
+        return self.publish_batch(items) and self.wait_for_echo()
         
-        # 2. Publish to legacy messages topic
-        logger.info("\n=== TEST: Legacy Messages Topic ===")
-        self.publish_message(LEGACY_MESSAGES_TOPIC, CONSULTATION_REQUEST)
-        time.sleep(2)
+    def __enter__(self):
+        if not self.connect():
+            raise ConnectionError(f"Could not connect to MQTT broker at {self.broker}:{self.port}")
+        return self
+        
+    def __exit__(self, exc_type, exc, tb):
+        self.disconnect()
         
     def run_all_tests(self):
-        """Run all test scenarios."""
-        if not self.connect():
+        """Run all test scenarios, reusing the connection if the tester is already connected."""
+        # Only tear down a connection this call opened, so repeated runs share one session
+        owns_connection = not self.connected
+        if owns_connection and not self.connect():
             return False
             
         try:
             logger.info("\n=== STARTING INTEGRATION TESTS ===\n")
             
-            # Run test sequences
-            self.simulate_availability_sequence()
-            self.simulate_consultation_request()
-            self.simulate_legacy_topics()
+            # Run the scenarios one after another: they all change the same faculty's
+            # status topic, so running them together would interleave the status sequence
+            scenarios = (self.simulate_availability_sequence,
+                         self.simulate_consultation_request,
+                         self.simulate_legacy_topics)
+            results = []
+            for scenario in scenarios:
+                passed = scenario()
+                if not passed:
+                    logger.error(f"Scenario {scenario.__name__} failed")
+                results.append(passed)
             
             logger.info("\n=== TESTS COMPLETED ===\n")
             
             # Print summary
-            logger.info(f"Received {len(self.received_messages)} messages during testing")
+            logger.info(f"Received {self.received_count} messages during testing")
             
-            return True
+            return all(results)
         except Exception as e:
             logger.error(f"Error during tests: {e}")
             return False
         finally:
-            self.disconnect()
+            if owns_connection:
+                self.disconnect()
 
 def main():
     parser = argparse.ArgumentParser(description="ConsultEase Faculty Desk Integration Test")
@@ -270,13 +478,22 @@ def main():
     parser.add_argument("--username", default=DEFAULT_USERNAME, help=f"MQTT username (default: {DEFAULT_USERNAME})")
     parser.add_argument("--password", default=DEFAULT_PASSWORD, help=f"MQTT password (default: {DEFAULT_PASSWORD})")
     parser.add_argument("--faculty-id", type=int, default=DEFAULT_FACULTY_ID, help=f"Faculty ID to use (default: {DEFAULT_FACULTY_ID})")
+    parser.add_argument("--runs", type=int, default=1, help="Number of times to run the tests over one connection (default: 1)")
     
     args = parser.parse_args()
     
     tester = FacultyDeskTester(
         args.broker, args.port, args.username, args.password, args.faculty_id)
     
-    if tester.run_all_tests():
+    try:
+        # Connect once and reuse the session for every run
+        with tester:
+            success = all([tester.run_all_tests() for _ in range(args.runs)])
+    except ConnectionError as e:
+        logger.error(str(e))
+        success = False
+    
+    if success:
         logger.info("All tests completed successfully")
         return 0
     else: